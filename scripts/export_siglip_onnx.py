@@ -0,0 +1,54 @@
+"""Export the SigLIP vision tower to ONNX for ONNX Runtime inference.
+
+Usage:
+    uv run python scripts/export_siglip_onnx.py siglip_vision.onnx [--fp16]
+
+Then point the detector at it in the config file:
+    [detector]
+    onnx_path = "/path/to/siglip_vision.onnx"
+"""
+
+import argparse
+
+import torch
+from transformers import SiglipModel
+
+from studywatchdog.config import DetectorConfig
+
+
+class VisionEncoder(torch.nn.Module):
+    """Vision tower returning only the pooled image embeddings."""
+
+    def __init__(self, model: SiglipModel) -> None:
+        super().__init__()
+        self.vision_model = model.vision_model
+
+    def forward(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        return self.vision_model(pixel_values=pixel_values).pooler_output
+
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("output", help="Path of the .onnx file to write")
+parser.add_argument("--model", default=DetectorConfig().model_name, help="HuggingFace model id")
+parser.add_argument("--fp16", action="store_true", help="Export in FP16 (needs CUDA)")
+args = parser.parse_args()
+
+device = "cuda" if args.fp16 else "cpu"
+dtype = torch.float16 if args.fp16 else torch.float32
+
+model = SiglipModel.from_pretrained(args.model, dtype=dtype).to(device).eval()
+encoder = VisionEncoder(model)
+size = model.config.vision_config.image_size
+dummy = torch.zeros((1, 3, size, size), dtype=dtype, device=device)
+
+torch.onnx.export(
+    encoder,
+    (dummy,),
+    args.output,
+    input_names=["pixel_values"],
+    output_names=["image_embeds"],
+    dynamic_shapes={"pixel_values": {0: torch.export.Dim("batch", min=1, max=16)}},
+    opset_version=17,
+    dynamo=True,
+)
+print(f"Exported {args.model} vision tower ({dtype}) to {args.output}")
@@ -21,7 +21,7 @@ for i in range(3):
     print(f"\nFrame {i+1}: {result.status.value} (conf={result.confidence:.3f})")
     print(f"  Study={result.studying_score:.3f}  Distract={result.not_studying_score:.3f}  Absent={result.absent_score:.3f}")
     print(f"  Inference: {result.inference_ms:.0f}ms")
-    for text, score in sorted(result.scores.items(), key=lambda x: -x[1]):
-        print(f"    {score:.4f}  {text}")
+    for j in np.argsort(-result.scores):
+        print(f"    {result.scores[j]:.4f}  {det.labels[j]}")
 
 cap.release()
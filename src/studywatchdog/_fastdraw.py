@@ -0,0 +1,54 @@
+"""Drawing kernels for the debug overlay.
+
+The semi-transparent banner is blended in place by a Numba-compiled loop
+when Numba is installed. Without Numba it falls back to two in-place
+OpenCV calls. Neither allocates a temporary color image per frame.
+"""
+
+import cv2
+import numpy as np
+
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+def _blend_fill_kernel(sub: np.ndarray, b: int, g: int, r: int, alpha: float) -> None:
+    """Blend a solid BGR color into ``sub`` in place (loop form, for Numba).
+
+    Computes ``alpha * color + (1 - alpha) * pixel`` per channel, rounded to
+    nearest like ``cv2.addWeighted``.
+    """
+    beta = 1.0 - alpha
+    # +0.5 so the uint8 truncation rounds to nearest
+    cb = alpha * b + 0.5
+    cg = alpha * g + 0.5
+    cr = alpha * r + 0.5
+    for y in range(sub.shape[0]):
+        for x in range(sub.shape[1]):
+            sub[y, x, 0] = np.uint8(cb + beta * sub[y, x, 0])
+            sub[y, x, 1] = np.uint8(cg + beta * sub[y, x, 1])
+            sub[y, x, 2] = np.uint8(cr + beta * sub[y, x, 2])
+
+
+def _blend_fill_cv2(sub: np.ndarray, b: int, g: int, r: int, alpha: float) -> None:
+    """Blend a solid BGR color into ``sub`` in place (OpenCV fallback).
+
+    Scales the pixels, then adds the scaled color as a scalar, so no
+    color image has to be allocated. Rounds twice, so results may differ
+    from ``cv2.addWeighted`` by 1.
+    """
+    cv2.convertScaleAbs(sub, sub, alpha=1.0 - alpha)
+    cv2.add(sub, (alpha * b, alpha * g, alpha * r, 0.0), sub)
+
+
+if _NUMBA_AVAILABLE:
+    blend_fill = numba.njit(cache=True, fastmath=True)(_blend_fill_kernel)
+    # Compile for DebugUI's argument types (int color, float alpha) now,
+    # rather than on the first drawn frame
+    blend_fill(np.zeros((1, 1, 3), dtype=np.uint8), 0, 0, 0, 0.5)
+else:
+    blend_fill = _blend_fill_cv2
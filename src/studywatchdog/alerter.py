@@ -2,17 +2,146 @@
 
 Primary alert: plays "Never Gonna Give You Up" when user is distracted too long.
 Must be interruptible: stops immediately when studying resumes.
-Uses pygame.mixer for audio playback.
+Uses pygame.mixer for audio playback, or optionally sounddevice + soundfile,
+which stream the file without loading the SDL stack.
 """
 
 import logging
 import time
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
 
 from studywatchdog.config import AlertConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _AudioBackend(Protocol):
+    """Looping audio player used by the Alerter."""
+
+    # Exceptions the backend raises for audio failures (set by open())
+    errors: tuple[type[Exception], ...]
+
+    def open(self, volume: float) -> None:
+        """Initialize the audio output. Raises on failure."""
+        ...
+
+    def play(self, path: Path) -> None:
+        """Start playing a file on loop. Raises on failure."""
+        ...
+
+    def stop(self) -> None:
+        """Stop playback."""
+        ...
+
+    def close(self) -> None:
+        """Release the audio output."""
+        ...
+
+
+class _PygameBackend:
+    """Plays audio through ``pygame.mixer.music`` (SDL)."""
+
+    def __init__(self) -> None:
+        self.errors: tuple[type[Exception], ...] = (OSError,)
+        self._mixer: Any = None
+        self._music: Any = None
+
+    def open(self, volume: float) -> None:
+        import pygame
+        import pygame.mixer
+
+        self.errors = (pygame.error, OSError)
+        pygame.mixer.init()
+        pygame.mixer.music.set_volume(volume)
+        self._mixer = pygame.mixer
+        self._music = pygame.mixer.music
+
+    def play(self, path: Path) -> None:
+        self._music.load(str(path))
+        self._music.play(loops=-1)  # Loop until stopped
+
+    def stop(self) -> None:
+        self._music.stop()
+
+    def close(self) -> None:
+        self._music.stop()
+        self._mixer.quit()
+
+
+class _SoundDeviceBackend:
+    """Streams audio with ``sounddevice`` (PortAudio), decoded by ``soundfile``.
+
+    The file is decoded block by block inside the stream callback and rewound
+    at the end, so memory stays at a few blocks regardless of track length.
+    """
+
+    def __init__(self) -> None:
+        self.errors: tuple[type[Exception], ...] = (OSError,)
+        self._sd: Any = None
+        self._sf: Any = None
+        self._volume = 1.0
+        self._file: Any = None
+        self._stream: Any = None
+
+    def open(self, volume: float) -> None:
+        import sounddevice
+        import soundfile
+
+        self.errors = (sounddevice.PortAudioError, soundfile.SoundFileError, OSError)
+        self._sd = sounddevice
+        self._sf = soundfile
+        self._volume = volume
+
+    def play(self, path: Path) -> None:
+        self._file = self._sf.SoundFile(str(path))
+        try:
+            self._stream = self._sd.OutputStream(
+                samplerate=self._file.samplerate,
+                channels=self._file.channels,
+                dtype="float32",
+                callback=self._fill,
+            )
+            self._stream.start()
+        except Exception:
+            # e.g. no output device: don't leak the open file (or stream)
+            self.stop()
+            raise
+
+    def _fill(self, outdata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
+        """PortAudio callback: fill ``outdata`` from the file, looping at EOF."""
+        filled = 0
+        while filled < frames:
+            n = len(self._file.read(dtype="float32", out=outdata[filled:]))
+            if n == 0:
+                if self._file.tell() == 0:  # Empty file
+                    outdata[filled:] = 0
+                    break
+                self._file.seek(0)
+            filled += n
+        outdata *= self._volume
+
+    def stop(self) -> None:
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        self.stop()
+
+
+_BACKENDS: dict[str, type[_AudioBackend]] = {
+    "pygame": _PygameBackend,
+    "sounddevice": _SoundDeviceBackend,
+}
+
+
 class Alerter:
     """Rickroll alert system with interruptible playback and cooldown.
 
@@ -22,12 +151,13 @@ class Alerter:
 
     def __init__(self, config: AlertConfig) -> None:
         self._config = config
+        self._backend = _BACKENDS[config.backend]()
         self._mixer_initialized = False
         self._is_playing = False
         self._last_alert_time: float = 0.0
 
     def _ensure_mixer(self) -> bool:
-        """Initialize pygame mixer if not already done.
+        """Initialize the audio backend if not already done.
 
         Returns:
             True if mixer is ready, False if initialization failed.
@@ -36,14 +166,15 @@ class Alerter:
             return True
 
         try:
-            import pygame.mixer
-
-            pygame.mixer.init()
-            pygame.mixer.music.set_volume(self._config.volume)
+            self._backend.open(self._config.volume)
             self._mixer_initialized = True
-            logger.info("Audio mixer initialized (volume=%.0f%%)", self._config.volume * 100)
+            logger.info(
+                "Audio mixer initialized (backend=%s, volume=%.0f%%)",
+                self._config.backend,
+                self._config.volume * 100,
+            )
             return True
-        except Exception as e:
+        except (ImportError, *self._backend.errors) as e:
             logger.error("Failed to initialize audio mixer: %s", e)
             return False
 
@@ -85,14 +216,11 @@ class Alerter:
             return
 
         try:
-            import pygame.mixer
-
-            pygame.mixer.music.load(str(self._config.rickroll_path))
-            pygame.mixer.music.play(loops=-1)  # Loop until stopped
+            self._backend.play(self._config.rickroll_path)
             self._is_playing = True
             self._last_alert_time = now
             logger.info("🎵 RICKROLL ACTIVATED! Never gonna give you up...")
-        except Exception as e:
+        except self._backend.errors as e:
             logger.error("Failed to play rickroll: %s", e)
 
     def stop(self) -> None:
@@ -101,12 +229,10 @@ class Alerter:
             return
 
         try:
-            import pygame.mixer
-
-            pygame.mixer.music.stop()
+            self._backend.stop()
             self._is_playing = False
             logger.info("🔇 Rickroll stopped — back to studying!")
-        except Exception as e:
+        except self._backend.errors as e:
             logger.error("Failed to stop rickroll: %s", e)
             self._is_playing = False
 
@@ -118,13 +244,7 @@ class Alerter:
     def cleanup(self) -> None:
         """Clean up audio resources."""
         if self._mixer_initialized:
-            try:
-                import pygame.mixer
-
-                pygame.mixer.music.stop()
-                pygame.mixer.quit()
-            except Exception:
-                pass
+            self._backend.close()
             self._mixer_initialized = False
             self._is_playing = False
             logger.info("Audio mixer cleaned up")
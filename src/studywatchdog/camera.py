@@ -5,7 +5,9 @@ Handles camera device selection, frame capture, and resource cleanup.
 
 import contextlib
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
@@ -14,32 +16,118 @@ from studywatchdog.config import CameraConfig
 
 logger = logging.getLogger(__name__)
 
+# Reads further apart than this may hit a frame queued by the driver.
+_STALE_READ_S = 0.1
+
+# How long ThreadedCamera.read_frame() waits for the capture thread.
+_THREAD_READ_TIMEOUT_S = 2.0
+
+
+def _probe_camera(index: int) -> bool:
+    """Check whether a camera index can be opened and delivers a frame."""
+    cap = cv2.VideoCapture(index)
+    try:
+        return cap.isOpened() and cap.read()[0]
+    finally:
+        cap.release()
+
 
 def list_cameras(max_index: int = 10) -> list[int]:
     """Probe available camera device indices.
 
+    Devices are probed in parallel: opening a device is mostly driver I/O
+    wait, so the total time is that of the slowest device, not the sum.
+
     Args:
         max_index: Maximum device index to check.
 
     Returns:
-        List of valid camera indices.
+        List of valid camera indices, sorted.
     """
-    available: list[int] = []
+    if max_index < 1:
+        return []
     # Suppress noisy V4L2 and FFMPEG warnings during probe
     with contextlib.suppress(AttributeError, cv2.error):
         cv2.setLogLevel(0)  # LOG_LEVEL_SILENT
     try:
-        for i in range(max_index):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, _ = cap.read()
-                if ret:
-                    available.append(i)
-                cap.release()
+        with ThreadPoolExecutor(max_workers=max_index) as pool:
+            found = pool.map(_probe_camera, range(max_index))
+            return [i for i, ok in enumerate(found) if ok]
     finally:
         with contextlib.suppress(AttributeError, cv2.error):
             cv2.setLogLevel(3)  # LOG_LEVEL_WARNING (default)
-    return available
+
+
+def frame_dhash(frame: np.ndarray) -> int:
+    """Compute a 64-bit difference hash (dHash) of a frame.
+
+    The frame is shrunk to 9×8 grayscale and each bit records whether a pixel
+    is brighter than its left neighbour. Similar images give hashes with a
+    small Hamming distance; sensor noise barely moves it.
+
+    Args:
+        frame: BGR image as numpy array.
+
+    Returns:
+        The hash as a Python int.
+    """
+    small = cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    bits = gray[:, 1:] > gray[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class FrameBuffer:
+    """Fixed-capacity buffer of captured frames for batched detection.
+
+    Frames are copied into a single pre-allocated ``(capacity, H, W, 3)`` uint8
+    array, so filling the buffer never allocates. The storage is reallocated
+    (dropping buffered frames) only if the frame shape changes, e.g. after
+    switching camera.
+
+    Args:
+        capacity: Number of frames per batch.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._storage: np.ndarray | None = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the buffer holds ``capacity`` frames."""
+        return self._count >= self._capacity
+
+    def push(self, frame: np.ndarray) -> None:
+        """Copy a frame into the next free slot.
+
+        Args:
+            frame: BGR frame as numpy array.
+
+        Raises:
+            OverflowError: If the buffer is already full.
+        """
+        if self.is_full:
+            raise OverflowError("FrameBuffer is full, call clear() first")
+        if self._storage is None or self._storage.shape[1:] != frame.shape:
+            self._storage = np.empty((self._capacity, *frame.shape), dtype=np.uint8)
+            self._count = 0
+        self._storage[self._count] = frame
+        self._count += 1
+
+    def frames(self) -> np.ndarray:
+        """Return a ``(N, H, W, 3)`` view of the buffered frames (no copy)."""
+        if self._storage is None:
+            return np.empty((0, 0, 0, 3), dtype=np.uint8)
+        return self._storage[: self._count]
+
+    def clear(self) -> None:
+        """Drop all buffered frames (storage is kept for reuse)."""
+        self._count = 0
 
 
 class Camera:
@@ -53,6 +141,8 @@ class Camera:
         self._config = config
         self._cap: cv2.VideoCapture | None = None
         self._last_capture_time: float = 0.0
+        self._last_read_time: float = 0.0
+        self._last_dhash: int | None = None
 
     def open(self) -> None:
         """Open the camera device.
@@ -68,6 +158,11 @@ class Camera:
                 f"Available cameras: {list_cameras()}"
             )
 
+        # Keep at most one frame queued so reads return the current scene, and
+        # ask for MJPG so USB cameras send compressed data (less driver copying).
+        # Backends that don't support a property simply ignore it.
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._config.frame_width)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._config.frame_height)
 
@@ -79,11 +174,19 @@ class Camera:
     def read_frame(self) -> np.ndarray | None:
         """Read a single frame from the camera.
 
+        After a long pause between reads (e.g. during inference), the frame
+        still queued in the driver is discarded first so the returned frame
+        shows the current scene.
+
         Returns:
             BGR frame as numpy array, or None if read failed.
         """
         if self._cap is None or not self._cap.isOpened():
             return None
+        now = time.monotonic()
+        if now - self._last_read_time > _STALE_READ_S:
+            self._cap.grab()
+        self._last_read_time = now
         ret, frame = self._cap.read()
         if not ret:
             logger.warning("Failed to read frame from camera %d", self._config.camera_index)
@@ -102,6 +205,43 @@ class Camera:
             return True
         return False
 
+    def seconds_until_next_capture(self) -> float:
+        """Time left until ``should_capture()`` returns True again.
+
+        Returns:
+            Seconds to wait (0.0 if a capture is already due).
+        """
+        next_capture = self._last_capture_time + self._config.capture_interval
+        return max(0.0, next_capture - time.monotonic())
+
+    def should_infer(self, frame: np.ndarray, *, force: bool = False) -> bool:
+        """Check if a frame differs enough from the last analyzed one.
+
+        Compares dHashes with ``scene_change_bits`` as threshold. The stored
+        hash is only updated when this returns True, so slow drift still adds
+        up to a detected change.
+
+        Args:
+            frame: Captured BGR frame.
+            force: Analyze the frame regardless (e.g. to fill a batch). It
+                still becomes the reference for the next comparison.
+
+        Returns:
+            True if the frame should be sent to the detector.
+        """
+        threshold = self._config.scene_change_bits
+        if threshold == 0:
+            return True
+        dhash = frame_dhash(frame)
+        if (
+            not force
+            and self._last_dhash is not None
+            and (dhash ^ self._last_dhash).bit_count() < threshold
+        ):
+            return False
+        self._last_dhash = dhash
+        return True
+
     def close(self) -> None:
         """Release the camera device."""
         if self._cap is not None:
@@ -115,3 +255,80 @@ class Camera:
 
     def __exit__(self, *args: object) -> None:
         self.close()
+
+
+class ThreadedCamera(Camera):
+    """Camera that captures frames on a background thread.
+
+    The thread reads continuously and keeps only the most recent frame, so
+    ``read_frame()`` never waits on the device while the main loop is busy with
+    inference, and the frame it returns is always the newest one.
+
+    Args:
+        config: Camera configuration settings.
+    """
+
+    def __init__(self, config: CameraConfig) -> None:
+        super().__init__(config)
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._has_new = threading.Event()
+        self._latest: np.ndarray | None = None
+
+    def open(self) -> None:
+        """Open the camera device and start the capture thread.
+
+        Raises:
+            RuntimeError: If the camera cannot be opened.
+        """
+        super().open()
+        self._stop.clear()
+        self._has_new.clear()
+        self._latest = None
+        self._thread = threading.Thread(
+            target=self._capture_loop,
+            name=f"camera-{self._config.camera_index}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _capture_loop(self) -> None:
+        """Read frames until stopped or the device fails."""
+        while not self._stop.is_set():
+            frame = super().read_frame()
+            if frame is None:
+                break
+            self._latest = frame
+            self._has_new.set()
+        # Wake up a reader waiting for a frame that will never come
+        self._has_new.set()
+
+    def read_frame(self) -> np.ndarray | None:
+        """Return the most recent frame captured by the thread.
+
+        Waits for a frame newer than the previous call, up to a timeout;
+        on timeout the last frame is returned again. The first frame is
+        waited for as long as the thread runs (slow devices can take seconds
+        to deliver it).
+
+        Returns:
+            BGR frame as numpy array, or None if capture has stopped.
+        """
+        if self._thread is None:
+            return None
+        while True:
+            self._has_new.wait(_THREAD_READ_TIMEOUT_S)
+            self._has_new.clear()
+            if not self._thread.is_alive():
+                return None
+            if self._latest is not None:
+                return self._latest
+            logger.info("Waiting for the first frame from camera %d ...", self._config.camera_index)
+
+    def close(self) -> None:
+        """Stop the capture thread and release the camera device."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        super().close()
@@ -3,24 +3,156 @@
 Prevents single-frame noise from triggering false alerts.
 Uses Exponential Moving Average for score smoothing and
 a FSM with temporal tolerance for state transitions.
+
+``replay_decisions`` runs the same logic over a whole recorded session at
+once (offline evaluation / threshold tuning), JIT-compiled with Numba when
+it is installed.
 """
 
 import enum
 import logging
 import time
+from collections.abc import Callable
+
+import numpy as np
 
 from studywatchdog.config import DecisionConfig
 from studywatchdog.detector import ActivityStatus, DetectionResult
 
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-class StudyState(enum.Enum):
-    """FSM states for the study monitor."""
+class StudyState(enum.IntEnum):
+    """FSM states for the study monitor.
+
+    Integer-valued so states compare and hash as plain ints, and so
+    ``replay_decisions`` can return them as a compact int8 array.
+    """
+
+    STUDYING = 0
+    DISTRACTED = 1
+    ALERT_ACTIVE = 2
+
+
+# Max growth of the d^-k weights inside one ema_series() chunk; keeps the
+# cumulative sum well within float64 precision
+_EMA_MAX_GROWTH = 1e6
+
+
+def ema_series(raw: np.ndarray, alpha: float, initial: float = 1.0) -> np.ndarray:
+    """Compute every step of an EMA at once, without a Python loop per sample.
+
+    Uses the closed form ``ema_t = d^t * (initial + alpha * sum_k x_k * d^-k)``
+    with ``d = 1 - alpha``. The ``d^-k`` weights grow geometrically, so the
+    series is processed in chunks short enough that they stay bounded, each
+    chunk starting from the previous chunk's last value.
+
+    Args:
+        raw: Raw scores, oldest first.
+        alpha: EMA weight of the newest score.
+        initial: EMA value before the first score.
+
+    Returns:
+        float64 array where element ``t`` is the EMA after ``raw[t]``.
+
+    Raises:
+        ValueError: If ``alpha`` is not in (0, 1].
+    """
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+    x = np.asarray(raw, dtype=np.float64)
+    if alpha == 1.0:
+        return x.copy()
+    decay = 1.0 - alpha
+    chunk = max(1, int(np.log(_EMA_MAX_GROWTH) / -np.log(decay)))
+    powers = decay ** np.arange(1, chunk + 1)  # d^1 .. d^chunk
+    out = np.empty_like(x)
+    prev = initial
+    for start in range(0, len(x), chunk):
+        seg = x[start : start + chunk]
+        p = powers[: len(seg)]
+        out[start : start + len(seg)] = p * (prev + alpha * np.cumsum(seg / p))
+        prev = out[start + len(seg) - 1]
+    return out
+
+
+def _run_decision_py(
+    ratios: np.ndarray,
+    timestamps: np.ndarray,
+    alpha: float,
+    threshold: float,
+    distraction_timeout: float,
+    recovery_time: float,
+) -> np.ndarray:
+    """EMA + FSM over a whole session; mirrors ``DecisionEngine.update``.
+
+    Written with scalar loops only so Numba can compile it in nopython mode;
+    states are the ``StudyState`` integer values.
+    """
+    n = ratios.shape[0]
+    states = np.empty(n, dtype=np.int8)
+    state = 0
+    ema = 1.0
+    entered_at = timestamps[0] if n > 0 else 0.0
+    for i in range(n):
+        ema = alpha * ratios[i] + (1.0 - alpha) * ema
+        is_studying = ema >= threshold
+        now = timestamps[i]
+        time_in_state = now - entered_at
+        if state == 0:
+            if not is_studying:
+                state = 1
+                entered_at = now
+        elif state == 1:
+            if is_studying:
+                if time_in_state >= recovery_time:
+                    state = 0
+                    entered_at = now
+            elif time_in_state >= distraction_timeout:
+                state = 2
+                entered_at = now
+        elif is_studying:
+            state = 0
+            entered_at = now
+        states[i] = state
+    return states
+
+
+_run_decision = numba.njit(cache=True)(_run_decision_py) if _NUMBA_AVAILABLE else _run_decision_py
+
+
+def replay_decisions(
+    ratios: np.ndarray, timestamps: np.ndarray, config: DecisionConfig
+) -> np.ndarray:
+    """Run the decision logic over a recorded session in one call.
+
+    Equivalent to feeding each sample to a fresh ``DecisionEngine`` (created
+    at the first timestamp), but fast enough for hours of footage.
+
+    Args:
+        ratios: Per-sample studying ratios in [0, 1] (see
+            ``DecisionEngine.studying_ratio``).
+        timestamps: Per-sample times in seconds, non-decreasing.
+        config: Decision engine configuration.
 
-    STUDYING = "STUDYING"
-    DISTRACTED = "DISTRACTED"
-    ALERT_ACTIVE = "ALERT_ACTIVE"
+    Returns:
+        int8 array of per-sample ``StudyState`` values.
+    """
+    return _run_decision(
+        np.ascontiguousarray(ratios, dtype=np.float64),
+        np.ascontiguousarray(timestamps, dtype=np.float64),
+        config.ema_alpha,
+        config.studying_threshold,
+        config.distraction_timeout,
+        config.recovery_time,
+    )
 
 
 class DecisionEngine:
@@ -40,6 +172,12 @@ class DecisionEngine:
         self._ema_studying: float = 1.0  # Start assuming studying
         self._state_entered_at: float = time.monotonic()
         self._last_detection: DetectionResult | None = None
+        # Per-state FSM step, dispatched on the current state in update()
+        self._handlers: dict[StudyState, Callable[[bool, float], StudyState]] = {
+            StudyState.STUDYING: self._on_studying,
+            StudyState.DISTRACTED: self._on_distracted,
+            StudyState.ALERT_ACTIVE: self._on_alert_active,
+        }
 
     @property
     def state(self) -> StudyState:
@@ -61,19 +199,25 @@ class DecisionEngine:
         """Most recent detection result."""
         return self._last_detection
 
-    def _transition_to(self, new_state: StudyState) -> None:
-        """Transition to a new FSM state."""
+    def _transition_to(self, new_state: StudyState, now: float) -> None:
+        """Transition to a new FSM state.
+
+        Args:
+            new_state: State to enter.
+            now: ``time.monotonic()`` sampled by the caller for this update.
+        """
         old_state = self._state
         self._state = new_state
-        self._state_entered_at = time.monotonic()
+        self._state_entered_at = now
         logger.info(
             "State: %s -> %s (EMA=%.2f)",
-            old_state.value,
-            new_state.value,
+            old_state.name,
+            new_state.name,
             self._ema_studying,
         )
 
-    def _compute_studying_ratio(self, result: DetectionResult) -> float:
+    @staticmethod
+    def studying_ratio(result: DetectionResult) -> float:
         """Compute a 0-1 studying ratio from detection scores.
 
         Maps the raw detection scores to a single float where
@@ -108,39 +252,58 @@ class DecisionEngine:
         self._last_detection = result
 
         # Update EMA
-        raw_score = self._compute_studying_ratio(result)
+        raw_score = self.studying_ratio(result)
         alpha = self._config.ema_alpha
         self._ema_studying = alpha * raw_score + (1.0 - alpha) * self._ema_studying
 
         is_studying = self._ema_studying >= self._config.studying_threshold
         now = time.monotonic()
-        time_in_state = now - self._state_entered_at
+        new_state = self._handlers[self._state](is_studying, now - self._state_entered_at)
+        if new_state is not self._state:
+            self._transition_to(new_state, now)
+        return self._state
 
-        # FSM transitions
-        if self._state == StudyState.STUDYING:
-            if not is_studying:
-                self._transition_to(StudyState.DISTRACTED)
+    def _on_studying(self, is_studying: bool, time_in_state: float) -> StudyState:
+        """FSM step in STUDYING; returns the next state."""
+        return StudyState.STUDYING if is_studying else StudyState.DISTRACTED
 
-        elif self._state == StudyState.DISTRACTED:
-            if is_studying and time_in_state >= self._config.recovery_time:
+    def _on_distracted(self, is_studying: bool, time_in_state: float) -> StudyState:
+        """FSM step in DISTRACTED; returns the next state."""
+        if is_studying:
+            if time_in_state >= self._config.recovery_time:
                 # Recovered: back to studying
-                self._transition_to(StudyState.STUDYING)
-            elif is_studying:
-                # Still recovering, stay distracted but log
-                logger.debug(
-                    "Recovering... %.1fs / %.1fs",
-                    time_in_state,
-                    self._config.recovery_time,
-                )
-            elif not is_studying and time_in_state >= self._config.distraction_timeout:
-                # Distracted too long: trigger alert
-                self._transition_to(StudyState.ALERT_ACTIVE)
-
-        elif self._state == StudyState.ALERT_ACTIVE and is_studying:
-            # Resumed studying: stop alert
-            self._transition_to(StudyState.STUDYING)
+                return StudyState.STUDYING
+            # Still recovering, stay distracted but log
+            logger.debug("Recovering... %.1fs / %.1fs", time_in_state, self._config.recovery_time)
+        elif time_in_state >= self._config.distraction_timeout:
+            # Distracted too long: trigger alert
+            return StudyState.ALERT_ACTIVE
+        return StudyState.DISTRACTED
+
+    def _on_alert_active(self, is_studying: bool, time_in_state: float) -> StudyState:
+        """FSM step in ALERT_ACTIVE; returns the next state."""
+        # Resumed studying: stop alert
+        return StudyState.STUDYING if is_studying else StudyState.ALERT_ACTIVE
+
+    def update_batch(self, raw_scores: np.ndarray, initial: float | None = None) -> np.ndarray:
+        """Feed a sequence of studying ratios into the EMA in one vectorized step.
+
+        For backfilling buffered scores (e.g. after a pause) or evaluation.
+        Only the EMA advances; FSM transitions are left to the next
+        ``update()``, since per-sample timing isn't known here.
 
-        return self._state
+        Args:
+            raw_scores: Studying ratios in [0, 1], oldest first.
+            initial: EMA to start from (default: the current EMA).
+
+        Returns:
+            The EMA after each score; the last one becomes the current EMA.
+        """
+        start = self._ema_studying if initial is None else initial
+        series = ema_series(raw_scores, self._config.ema_alpha, start)
+        if len(series):
+            self._ema_studying = float(series[-1])
+        return series
 
     def reset(self) -> None:
         """Reset the engine to initial state."""
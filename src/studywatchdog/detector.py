@@ -4,24 +4,48 @@ Uses SigLIP (google/siglip-base-patch16-224) to compute similarity scores
 between webcam frames and text descriptions of activities.
 
 Output is numerical scores (0.0-1.0), NOT generated text.
+
+Loading is slow on purpose: ``SigLIPDetector.load()`` ends with a few dummy
+detections (``warmup_steps``), so it may take several seconds — longer with
+``compile_vision`` — but the first real frame then runs at steady-state speed.
 """
 
 import enum
+import hashlib
 import logging
+import threading
 import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from typing import Protocol
+from pathlib import Path
+from typing import Any, Protocol
 
 import numpy as np
 import torch
+import torch.nn.functional as F
 from huggingface_hub import try_to_load_from_cache
-from PIL import Image
+from safetensors import SafetensorError
+from safetensors.torch import load_file, save_file
 from transformers import SiglipImageProcessor, SiglipModel, SiglipTokenizer
 
-from studywatchdog.config import DetectorConfig
+from studywatchdog.config import CACHE_DIR, DetectorConfig
 
 logger = logging.getLogger(__name__)
 
+_PRECISION_DTYPES: dict[str, torch.dtype] = {
+    "fp32": torch.float32,
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+    # int8: dynamically quantized Linear weights, FP32 activations (CPU only)
+    "int8": torch.float32,
+}
+
+# ONNX input element types → torch dtype used for preprocessing
+_ONNX_DTYPES: dict[str, torch.dtype] = {
+    "tensor(float)": torch.float32,
+    "tensor(float16)": torch.float16,
+}
+
 
 class ActivityStatus(enum.Enum):
     """Detected activity classification."""
@@ -31,17 +55,28 @@ class ActivityStatus(enum.Enum):
     ABSENT = "absent"
 
 
-@dataclass
+# Order of the category columns produced by SigLIPDetector
+_CATEGORY_STATUSES = (
+    ActivityStatus.STUDYING,
+    ActivityStatus.NOT_STUDYING,
+    ActivityStatus.ABSENT,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DetectionResult:
     """Result of a single frame detection.
 
+    Immutable, since the main loop may reuse one result for several frames.
+
     Attributes:
         status: Classified activity.
         confidence: Confidence score (0.0-1.0) for the winning class.
         studying_score: Aggregated score for studying candidates.
         not_studying_score: Aggregated score for not-studying candidates.
         absent_score: Aggregated score for absent candidates.
-        scores: Per-candidate raw scores.
+        scores: Per-candidate scores, aligned with ``SigLIPDetector.labels``.
+            Not part of equality or hashing (arrays support neither).
         inference_ms: Inference time in milliseconds.
     """
 
@@ -50,7 +85,7 @@ class DetectionResult:
     studying_score: float
     not_studying_score: float
     absent_score: float
-    scores: dict[str, float] = field(default_factory=dict)
+    scores: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32), compare=False)
     inference_ms: float = 0.0
 
 
@@ -68,6 +103,17 @@ class Detector(Protocol):
         """
         ...
 
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> list[DetectionResult]:
+        """Analyze several frames at once and return one result per frame.
+
+        Args:
+            frames: BGR images as numpy arrays (from OpenCV), in capture order.
+
+        Returns:
+            List of DetectionResult, in the same order as ``frames``.
+        """
+        ...
+
     def is_loaded(self) -> bool:
         """Check if the model is loaded and ready."""
         ...
@@ -86,14 +132,27 @@ class SigLIPDetector:
     def __init__(self, config: DetectorConfig) -> None:
         self._config = config
         self._model: SiglipModel | None = None
+        self._vision: Callable[..., Any] | None = None
+        self._graph: torch.cuda.CUDAGraph | None = None
+        self._static_pixels: torch.Tensor | None = None
+        self._static_embeds: torch.Tensor | None = None
+        self._ort_session: Any | None = None
+        self._embed_dim = 0
+        self._input_size = 0
+        # True once the vision tower's patch embedding takes BGR channel order
+        self._bgr_input = False
+        # Page-locked uint8 staging buffer for host → GPU frame uploads (CUDA only)
+        self._pinned_frames: torch.Tensor | None = None
         self._tokenizer: SiglipTokenizer | None = None
         self._image_processor: SiglipImageProcessor | None = None
         self._device: torch.device | None = None
-        self._text_inputs: dict | None = None
-        self._all_candidates: list[str] = []
-        self._studying_indices: list[int] = []
-        self._not_studying_indices: list[int] = []
-        self._absent_indices: list[int] = []
+        self._dtype: torch.dtype = torch.float32
+        self._quantize_int8 = False
+        # Normalized text embeddings × logit_scale, transposed to (D, K)
+        self._text_weights: torch.Tensor | None = None
+        self._labels: tuple[str, ...] = ()
+        # (K, 3) one-hot matrix mapping each candidate to its category column
+        self._group_mask: torch.Tensor | None = None
 
     def _resolve_device(self) -> torch.device:
         """Determine the best available device."""
@@ -111,15 +170,39 @@ class SigLIPDetector:
             logger.info("Using device: %s", device)
         return device
 
-    def load(self) -> None:
+    def _resolve_dtype(self, device: torch.device) -> torch.dtype:
+        """Determine the weight/activation dtype for the vision tower."""
+        precision = self._config.precision
+        if precision == "int8" and device.type != "cpu":
+            logger.warning("int8 precision is only supported on CPU, using auto")
+            precision = "auto"
+        if precision == "auto":
+            # Half precision doubles tensor-core throughput on CUDA; CPUs gain little
+            precision = "fp16" if device.type == "cuda" else "fp32"
+        self._quantize_int8 = precision == "int8"
+        dtype = _PRECISION_DTYPES[precision]
+        logger.info("Inference precision: %s", precision)
+        return dtype
+
+    def load(self, frame_shape: tuple[int, int] | None = None) -> None:
         """Load the SigLIP model and pre-compute text embeddings.
 
         This is called lazily on first detection, not at import time.
+
+        Args:
+            frame_shape: ``(height, width)`` of the frames that will be
+                analyzed, so the warmup runs at that size. Defaults to the
+                model input size.
         """
         logger.info("Loading SigLIP model: %s ...", self._config.model_name)
         start = time.monotonic()
 
         self._device = self._resolve_device()
+        self._dtype = self._resolve_dtype(self._device)
+        if self._device.type == "cuda":
+            # Input shapes are fixed (batch_size x input_size), so cuDNN's
+            # per-shape kernel autotuning runs once, during warmup
+            torch.backends.cudnn.benchmark = True
 
         # Use cached model if available — avoids HTTP requests to HuggingFace on every run
         local_only = self._is_model_cached(self._config.model_name)
@@ -127,44 +210,75 @@ class SigLIPDetector:
             logger.debug("Model found in cache, loading offline")
 
         self._model = SiglipModel.from_pretrained(
-            self._config.model_name, local_files_only=local_only
+            self._config.model_name, local_files_only=local_only, dtype=self._dtype
         ).to(self._device)
         self._model.eval()
-        self._tokenizer = SiglipTokenizer.from_pretrained(
-            self._config.model_name, local_files_only=local_only
-        )
         self._image_processor = SiglipImageProcessor.from_pretrained(
             self._config.model_name, local_files_only=local_only
         )
-
-        # Build candidate list with tracked indices per category
-        self._all_candidates = []
-        self._studying_indices = []
-        self._not_studying_indices = []
-        self._absent_indices = []
-
-        for text in self._config.studying_candidates:
-            self._studying_indices.append(len(self._all_candidates))
-            self._all_candidates.append(text)
-
-        for text in self._config.not_studying_candidates:
-            self._not_studying_indices.append(len(self._all_candidates))
-            self._all_candidates.append(text)
-
-        for text in self._config.absent_candidates:
-            self._absent_indices.append(len(self._all_candidates))
-            self._all_candidates.append(text)
-
-        # Pre-compute text embeddings (they never change)
-        self._precompute_text_embeddings()
+        self._input_size = int(self._image_processor.size["height"])
+        self._init_preprocessing()
+
+        # Build candidate list grouped by category: studying | not studying | absent
+        n_study = len(self._config.studying_candidates)
+        n_not = len(self._config.not_studying_candidates)
+        self._labels = (
+            *self._config.studying_candidates,
+            *self._config.not_studying_candidates,
+            *self._config.absent_candidates,
+        )
+        n_absent = len(self._config.absent_candidates)
+        group_ids = torch.tensor([0] * n_study + [1] * n_not + [2] * n_absent)
+        self._group_mask = F.one_hot(group_ids, num_classes=3).float().to(self._device)
+
+        # Pre-compute text embeddings (they never change), or reuse them from disk
+        if not self._load_cached_text_weights():
+            self._tokenizer = SiglipTokenizer.from_pretrained(
+                self._config.model_name, local_files_only=local_only
+            )
+            self._precompute_text_embeddings()
+            self._save_cached_text_weights()
+        self._release_text_tower()
+
+        self._embed_dim = int(self._model.config.vision_config.hidden_size)
+        torch_dtype = self._dtype
+        if self._config.onnx_path is not None:
+            self._ort_session = self._load_onnx_session(self._config.onnx_path)
+        if self._ort_session is not None:
+            # At least one batch, so a broken session is caught while the
+            # PyTorch vision tower is still there to fall back on
+            try:
+                self.warmup(max(1, self._config.warmup_steps), frame_shape)
+            except Exception as e:
+                logger.warning("ONNX Runtime vision tower failed: %s — using PyTorch", e)
+                self._ort_session = None
+                self._dtype = torch_dtype
+            else:
+                self._release_vision_tower()
+        if self._ort_session is None:
+            self._init_torch_vision()
+            self.warmup(self._config.warmup_steps, frame_shape)
 
         elapsed = time.monotonic() - start
         logger.info(
             "SigLIP loaded in %.1fs (%d text candidates)",
             elapsed,
-            len(self._all_candidates),
+            len(self._labels),
         )
 
+    def _init_preprocessing(self) -> None:
+        """Cache the image normalization constants as device tensors.
+
+        Rescaling (1/255) and mean/std normalization are folded into a single
+        multiply-add: ``x * scale + shift``.
+        """
+        assert self._image_processor is not None
+        proc = self._image_processor
+        mean = torch.tensor(proc.image_mean, device=self._device).view(1, 3, 1, 1)
+        std = torch.tensor(proc.image_std, device=self._device).view(1, 3, 1, 1)
+        self._pixel_scale = proc.rescale_factor / std
+        self._pixel_shift = -mean / std
+
     @staticmethod
     def _is_model_cached(model_name: str) -> bool:
         """Check if the model files are already in the HuggingFace cache."""
@@ -176,25 +290,326 @@ class SigLIPDetector:
         assert self._tokenizer is not None
         assert self._model is not None
 
+        # Must stay "max_length": SigLIP was trained on 64-token padded text and
+        # pools the *last* token, so shorter padding changes the embeddings
         text_inputs = self._tokenizer(
-            self._all_candidates,
+            list(self._labels),
             padding="max_length",
             return_tensors="pt",
         ).to(self._device)
 
-        with torch.no_grad():
+        with torch.inference_mode():
             text_output = self._model.get_text_features(**text_inputs)
-            self._text_embeds = text_output.pooler_output
-            self._text_embeds = self._text_embeds / self._text_embeds.norm(dim=-1, keepdim=True)
-            # Cache logit_scale for inference (no bias — it breaks zero-shot)
-            self._logit_scale = self._model.logit_scale.exp()
+            # Similarity math stays in FP32 even when the towers run in half precision
+            text_embeds = text_output.pooler_output.float()
+            text_embeds = text_embeds / text_embeds.norm(dim=-1, keepdim=True)
+            # Fold logit_scale into the transposed (D, K) matrix, so per-frame
+            # logits are a single matmul (no bias — it breaks zero-shot)
+            logit_scale = self._model.logit_scale.float().exp()
+            self._text_weights = (text_embeds.t() * logit_scale).contiguous()
+
+        logger.debug("Pre-computed %d text embeddings", len(self._labels))
+
+    def _release_text_tower(self) -> None:
+        """Drop the text tower and tokenizer once the text weights exist.
+
+        Only the vision tower runs per frame; this frees ~100 MB of weights.
+        """
+        assert self._model is not None
+        del self._model.text_model
+        self._tokenizer = None
+        if self._device is not None and self._device.type == "cuda":
+            torch.cuda.empty_cache()
+        logger.debug("Released SigLIP text tower")
+
+    def _release_vision_tower(self) -> None:
+        """Drop the PyTorch vision tower when ONNX Runtime runs it instead.
+
+        Otherwise both copies of the weights would stay in (V)RAM.
+        """
+        assert self._model is not None
+        del self._model.vision_model
+        if self._device is not None and self._device.type == "cuda":
+            torch.cuda.empty_cache()
+        logger.debug("Released PyTorch vision tower (ONNX Runtime in use)")
+
+    def _text_cache_path(self) -> Path:
+        """Cache file for the text weights of this model, precision, and candidates."""
+        key = "\n".join([self._config.model_name, str(self._dtype), *self._labels])
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return CACHE_DIR / f"text_weights_{digest}.safetensors"
+
+    def _load_cached_text_weights(self) -> bool:
+        """Load text weights saved by a previous run, skipping the text tower.
+
+        Returns:
+            True if the cache was found and is valid.
+        """
+        path = self._text_cache_path()
+        try:
+            weights = load_file(path, device=str(self._device))["text_weights"]
+        except FileNotFoundError:
+            return False
+        except (OSError, KeyError, SafetensorError) as e:
+            logger.warning("Ignoring unreadable text embedding cache %s: %s", path, e)
+            return False
+        if weights.shape[1] != len(self._labels):
+            return False
+        self._text_weights = weights
+        logger.debug("Loaded %d text embeddings from %s", len(self._labels), path)
+        return True
+
+    def _save_cached_text_weights(self) -> None:
+        """Save the text weights for the next run (best effort)."""
+        assert self._text_weights is not None
+        path = self._text_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            save_file({"text_weights": self._text_weights.cpu()}, path)
+        except OSError as e:
+            logger.warning("Could not write text embedding cache %s: %s", path, e)
+
+    def _fold_bgr_to_rgb(self) -> None:
+        """Make the vision tower accept BGR frames as-is.
+
+        The patch embedding is a linear conv over the input channels, so
+        reversing its weights' channel axis (and the per-channel normalization
+        constants) is exactly equivalent to swapping BGR → RGB on every frame,
+        and that per-frame copy disappears.
+        """
+        assert self._model is not None
+        patch = self._model.vision_model.embeddings.patch_embedding
+        with torch.no_grad():
+            patch.weight.copy_(patch.weight.flip(1))
+        self._pixel_scale = self._pixel_scale.flip(1)
+        self._pixel_shift = self._pixel_shift.flip(1)
+        self._bgr_input = True
+
+    def _init_torch_vision(self) -> None:
+        """Set up the PyTorch vision tower (int8 / torch.compile / CUDA graph)."""
+        assert self._model is not None
+        assert self._device is not None
+        self._fold_bgr_to_rgb()
+        if self._quantize_int8:
+            # After text embeddings, so only the per-frame vision tower is quantized
+            self._model.vision_model = torch.ao.quantization.quantize_dynamic(
+                self._model.vision_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("Vision tower quantized to int8")
+
+        self._vision = self._model.vision_model
+        if self._config.compile_vision:
+            # Input shape is fixed, so compile once for static shapes
+            # Compilation happens lazily, during warmup()
+            self._vision = torch.compile(self._vision, mode="max-autotune", dynamic=False)
+        elif self._config.cuda_graph and self._device.type == "cuda":
+            # max-autotune already uses CUDA graphs, so only capture for eager mode
+            self._capture_cuda_graph()
+
+    def _load_onnx_session(self, path: Path) -> Any | None:
+        """Create an ONNX Runtime session for an exported vision tower.
+
+        See ``scripts/export_siglip_onnx.py``. The preprocessing dtype follows
+        the dtype the model was exported with.
+
+        Args:
+            path: Path to the exported ``.onnx`` file.
+
+        Returns:
+            The InferenceSession, or None to fall back to PyTorch if the file
+            or the optional ``onnxruntime`` package is missing, or the model's
+            input type is not supported, or the CUDA provider is unavailable
+            on a CUDA device.
+        """
+        assert self._device is not None
+        if not path.is_file():
+            logger.warning("ONNX model not found: %s — using PyTorch", path)
+            return None
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.warning("onnxruntime is not installed — using PyTorch")
+            return None
+
+        providers: list[Any] = ["CPUExecutionProvider"]
+        if self._device.type == "cuda":
+            providers.insert(0, ("CUDAExecutionProvider", {"device_id": self._device.index or 0}))
+        session = ort.InferenceSession(str(path), providers=providers)
+        if self._device.type == "cuda" and "CUDAExecutionProvider" not in session.get_providers():
+            # e.g. the CPU-only onnxruntime package: inputs are bound as CUDA memory
+            logger.warning("ONNX Runtime has no CUDA provider — using PyTorch")
+            return None
+        input_type = session.get_inputs()[0].type
+        if input_type not in _ONNX_DTYPES:
+            logger.warning("Unsupported ONNX input type %s in %s — using PyTorch", input_type, path)
+            return None
+        self._dtype = _ONNX_DTYPES[input_type]
+        logger.info("Using ONNX Runtime vision tower: %s (%s)", path, session.get_providers()[0])
+        return session
+
+    def _run_onnx(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        """Run the ONNX vision tower, binding torch tensors directly (no copies)."""
+        assert self._ort_session is not None
+        pixel_values = pixel_values.contiguous()
+        device = pixel_values.device
+        embeds = torch.empty(
+            (pixel_values.shape[0], self._embed_dim), dtype=pixel_values.dtype, device=device
+        )
+        if device.type == "cuda":
+            # ORT runs on its own stream: make sure preprocessing has finished
+            torch.cuda.current_stream(device).synchronize()
+
+        np_dtype = np.float16 if pixel_values.dtype == torch.float16 else np.float32
+        device_id = device.index or 0
+        binding = self._ort_session.io_binding()
+        binding.bind_input(
+            "pixel_values",
+            device.type,
+            device_id,
+            np_dtype,
+            tuple(pixel_values.shape),
+            pixel_values.data_ptr(),
+        )
+        binding.bind_output(
+            "image_embeds", device.type, device_id, np_dtype, tuple(embeds.shape), embeds.data_ptr()
+        )
+        self._ort_session.run_with_iobinding(binding)
+        return embeds
+
+    def warmup(self, steps: int, frame_shape: tuple[int, int] | None = None) -> None:
+        """Run dummy detections at the configured batch size.
+
+        Resolves one-time lazy work (CUDA context and allocator, kernel
+        selection, torch.compile autotuning, pinned buffers) so it doesn't
+        land on the first real frames. Called by ``load()``. Lazy state is
+        per shape (pinned buffer, resize kernels) and torch.compile's CUDA
+        graphs are per thread, so call it on the thread that will run
+        inference, with the real frame size.
+
+        Args:
+            steps: Number of dummy batches to run (0 = no-op).
+            frame_shape: ``(height, width)`` of the dummy frames. Defaults
+                to the model input size.
+        """
+        if steps <= 0:
+            return
+        start = time.monotonic()
+        height, width = frame_shape or (self._input_size, self._input_size)
+        dummy = np.zeros((self._config.batch_size, height, width, 3), dtype=np.uint8)
+        for _ in range(steps):
+            self.detect_batch(dummy)  # Ends with a device → host sync
+        logger.info("Warmed up with %d dummy batches in %.1fs", steps, time.monotonic() - start)
+
+    def _capture_cuda_graph(self) -> None:
+        """Capture the vision forward at the configured batch size as a CUDA graph.
+
+        Replaying the graph launches all kernels with a single call, removing
+        the per-kernel CPU dispatch that dominates small-batch latency.
+        Falls back to eager execution if capture fails.
+        """
+        assert self._vision is not None
+        shape = (self._config.batch_size, 3, self._input_size, self._input_size)
+        try:
+            with torch.inference_mode():
+                static_pixels = torch.zeros(shape, dtype=self._dtype, device=self._device)
+
+                # Warm up on a side stream before capture (lazy init, allocator)
+                stream = torch.cuda.Stream()
+                stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(stream):
+                    for _ in range(3):
+                        self._vision(pixel_values=static_pixels)
+                torch.cuda.current_stream().wait_stream(stream)
+
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph):
+                    static_embeds = self._vision(pixel_values=static_pixels).pooler_output
+        except RuntimeError as e:
+            logger.warning("CUDA graph capture failed, using eager inference: %s", e)
+            return
+
+        self._graph = graph
+        self._static_pixels = static_pixels
+        self._static_embeds = static_embeds
+        logger.debug("Captured CUDA graph for batch size %d", shape[0])
+
+    def _encode_images(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        """Run the vision tower, replaying the CUDA graph when the shape matches.
+
+        Must be called under ``torch.inference_mode()``. The returned tensor may
+        be the graph's static output buffer, overwritten by the next replay.
+        """
+        if self._ort_session is not None:
+            return self._run_onnx(pixel_values)
+        assert self._vision is not None
+        static = self._static_pixels
+        if self._graph is not None and static is not None and pixel_values.shape == static.shape:
+            if pixel_values is not static:
+                static.copy_(pixel_values)
+            self._graph.replay()
+            return self._static_embeds  # type: ignore[return-value]
+        return self._vision(pixel_values=pixel_values).pooler_output
+
+    def _upload(self, frames: np.ndarray) -> torch.Tensor:
+        """Copy raw uint8 frames to the inference device.
+
+        On CUDA the frames go through a reused pinned (page-locked) buffer:
+        copies from pageable memory are staged synchronously by the driver,
+        while pinned memory is DMA'd directly. Reusing the buffer is safe
+        because each batch ends with a device → host sync.
 
-        logger.debug("Pre-computed %d text embeddings", len(self._all_candidates))
+        Args:
+            frames: ``(B, H, W, 3)`` uint8 frames, any memory layout.
+
+        Returns:
+            The frames as a uint8 tensor on the inference device.
+        """
+        if self._device is None or self._device.type != "cuda":
+            # from_numpy rejects negative strides (e.g. a frame[:, :, ::-1] view)
+            return torch.from_numpy(np.ascontiguousarray(frames)).to(self._device)
+        if self._pinned_frames is None or self._pinned_frames.shape != frames.shape:
+            self._pinned_frames = torch.empty(frames.shape, dtype=torch.uint8, pin_memory=True)
+        self._pinned_frames.numpy()[...] = frames
+        return self._pinned_frames.to(self._device, non_blocking=True)
+
+    def _preprocess(self, frames: np.ndarray) -> torch.Tensor:
+        """Turn a batch of BGR uint8 frames into SigLIP pixel values on device.
+
+        Equivalent to SiglipImageProcessor (RGB, bicubic resize, rescale,
+        normalize) but runs as a few tensor ops on the inference device, so
+        only the raw uint8 frames are transferred. With the PyTorch backend
+        the channel swap is folded into the model (see ``_fold_bgr_to_rgb``).
+
+        Args:
+            frames: ``(B, H, W, 3)`` uint8 BGR frames.
+
+        Returns:
+            ``(B, 3, S, S)`` pixel values in the inference dtype.
+        """
+        images = self._upload(frames)
+        if not self._bgr_input:
+            images = images[..., [2, 1, 0]]  # BGR → RGB (ONNX models expect RGB)
+        images = images.permute(0, 3, 1, 2).float()  # NHWC → NCHW
+        size = (self._input_size, self._input_size)
+        if images.shape[-2:] != size:
+            images = F.interpolate(
+                images, size=size, mode="bicubic", align_corners=False, antialias=True
+            ).clamp_(0.0, 255.0)
+        static = self._static_pixels
+        if static is not None and static.shape == images.shape:
+            # Normalize straight into the CUDA graph's input buffer (no extra copy)
+            return torch.addcmul(self._pixel_shift, images, self._pixel_scale, out=static)
+        return torch.addcmul(self._pixel_shift, images, self._pixel_scale).to(self._dtype)
 
     def is_loaded(self) -> bool:
         """Check if the model is loaded and ready."""
         return self._model is not None
 
+    @property
+    def labels(self) -> tuple[str, ...]:
+        """Candidate texts, in the order of ``DetectionResult.scores``."""
+        return self._labels
+
     def detect(self, frame: np.ndarray) -> DetectionResult:
         """Analyze a frame using SigLIP zero-shot classification.
 
@@ -204,27 +619,36 @@ class SigLIPDetector:
         Returns:
             DetectionResult with per-category scores and classification.
         """
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> list[DetectionResult]:
+        """Analyze several frames with a single batched SigLIP forward pass.
+
+        Batching amortizes the fixed per-call overhead (kernel launches,
+        framework dispatch) across frames, which dominates at batch size 1.
+
+        Args:
+            frames: BGR images as numpy arrays (from OpenCV), in capture order.
+                A stacked ``(B, H, W, 3)`` array is accepted as well.
+
+        Returns:
+            One DetectionResult per frame, in the same order. ``inference_ms``
+            is the batch time divided evenly across frames.
+        """
         if not self.is_loaded():
             self.load()
 
-        assert self._image_processor is not None
-        assert self._model is not None
-        assert self._text_embeds is not None
+        assert self._text_weights is not None
+        assert self._group_mask is not None
 
         start = time.monotonic()
 
-        # Convert BGR (OpenCV) → RGB (PIL)
-        rgb_frame = frame[:, :, ::-1]
-        pil_image = Image.fromarray(rgb_frame)
+        batch = frames if isinstance(frames, np.ndarray) else np.stack(frames)
 
-        # Get image embedding
-        image_inputs = self._image_processor(images=pil_image, return_tensors="pt").to(
-            self._device
-        )
-
-        with torch.no_grad():
-            image_output = self._model.get_image_features(**image_inputs)
-            image_embeds = image_output.pooler_output
+        # Get image embeddings (vision tower only — text embeddings are cached)
+        with torch.inference_mode():
+            pixel_values = self._preprocess(batch)
+            image_embeds = self._encode_images(pixel_values).float()
             image_embeds = image_embeds / image_embeds.norm(dim=-1, keepdim=True)
 
             # Compute similarity scores (cosine similarity scaled by temperature)
@@ -232,29 +656,38 @@ class SigLIPDetector:
             # a training artifact that pushes all sigmoid outputs to ~0.0,
             # making zero-shot classification useless. Softmax over the scaled
             # cosine similarities gives proper relative probabilities.
-            logits = torch.matmul(image_embeds, self._text_embeds.t()) * self._logit_scale
-            probs = torch.softmax(logits, dim=-1).squeeze(0).cpu().numpy()
-
-        # Build per-candidate scores dict
-        per_candidate_scores: dict[str, float] = {}
-        for i, text in enumerate(self._all_candidates):
-            per_candidate_scores[text] = float(probs[i])
+            logits = torch.matmul(image_embeds, self._text_weights)
+            probs = torch.softmax(logits, dim=-1)
+
+            # Aggregate per category (max of candidates in each group) in one
+            # broadcast over the group mask: (B, K, 1) * (K, 3) → max over K.
+            # Probabilities are non-negative, so masked-out zeros never win.
+            category_probs = (probs.unsqueeze(-1) * self._group_mask).amax(dim=1)
+            # Copy candidates + categories to the host in one transfer
+            host = torch.cat([probs, category_probs], dim=-1).cpu().numpy()
+
+        n_candidates = len(self._labels)
+        inference_ms = (time.monotonic() - start) * 1000 / len(host)
+        return [
+            self._build_result(row[:n_candidates], row[n_candidates:], inference_ms) for row in host
+        ]
+
+    def _build_result(
+        self, probs: np.ndarray, category_probs: np.ndarray, inference_ms: float
+    ) -> DetectionResult:
+        """Wrap the probabilities of one frame into a DetectionResult.
 
-        # Aggregate scores per category (max of candidates in each group)
-        studying_score = float(max(probs[i] for i in self._studying_indices))
-        not_studying_score = float(max(probs[i] for i in self._not_studying_indices))
-        absent_score = float(max(probs[i] for i in self._absent_indices))
+        Args:
+            probs: Per-candidate probabilities, aligned with ``labels``.
+            category_probs: Studying / not studying / absent scores.
+            inference_ms: Inference time attributed to this frame.
+        """
+        studying_score, not_studying_score, absent_score = category_probs.tolist()
 
         # Classify based on highest category score
-        category_scores = {
-            ActivityStatus.STUDYING: studying_score,
-            ActivityStatus.NOT_STUDYING: not_studying_score,
-            ActivityStatus.ABSENT: absent_score,
-        }
-        status = max(category_scores, key=category_scores.get)  # type: ignore[arg-type]
-        confidence = category_scores[status]
-
-        inference_ms = (time.monotonic() - start) * 1000
+        best = int(category_probs.argmax())
+        status = _CATEGORY_STATUSES[best]
+        confidence = float(category_probs[best])
 
         logger.debug(
             "Detection: %s (%.2f) in %.0fms | study=%.2f distract=%.2f absent=%.2f",
@@ -272,6 +705,124 @@ class SigLIPDetector:
             studying_score=studying_score,
             not_studying_score=not_studying_score,
             absent_score=absent_score,
-            scores=per_candidate_scores,
+            scores=probs,
             inference_ms=inference_ms,
         )
+
+
+class AsyncSigLIPDetector:
+    """Runs a loaded SigLIPDetector on a background thread.
+
+    ``submit()`` never blocks the caller: it hands a batch to the worker,
+    replacing any batch still waiting (only the freshest frames matter).
+    Finished results are collected with ``poll()``, so the capture/UI loop
+    keeps running at camera rate while the model works.
+
+    Args:
+        detector: The detector to run. If it isn't loaded yet, the worker
+            loads and warms it up first, so the warmup happens on the thread
+            that runs inference (see ``wait_ready()``).
+        frame_shape: ``(height, width)`` of the frames that will be
+            submitted, passed on to ``SigLIPDetector.load()``.
+    """
+
+    def __init__(
+        self, detector: SigLIPDetector, *, frame_shape: tuple[int, int] | None = None
+    ) -> None:
+        self._detector = detector
+        self._frame_shape = frame_shape
+        self._ready = threading.Event()
+        self._load_error: Exception | None = None
+        self._cond = threading.Condition()
+        self._pending: np.ndarray | None = None
+        self._results: list[DetectionResult] = []
+        # Bumped by cancel(); results of batches started before it are dropped
+        self._generation = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="detector", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: load the detector, then detect pending batches and store the results."""
+        try:
+            if not self._detector.is_loaded():
+                self._detector.load(self._frame_shape)
+        except Exception as e:
+            self._load_error = e
+            return
+        finally:
+            self._ready.set()
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                frames, self._pending = self._pending, None
+                generation = self._generation
+            try:
+                results = self._detector.detect_batch(frames)
+            except Exception as e:
+                logger.error("Background detection failed: %s", e)
+                continue
+            with self._cond:
+                if generation == self._generation:
+                    self._results.extend(results)
+                    self._cond.notify_all()
+
+    def wait_ready(self) -> None:
+        """Block until the worker has loaded (and warmed up) the detector.
+
+        Raises:
+            Exception: Whatever ``SigLIPDetector.load()`` raised on the worker.
+        """
+        self._ready.wait()
+        if self._load_error is not None:
+            raise self._load_error
+
+    def submit(self, frames: np.ndarray) -> None:
+        """Queue a batch of frames for detection without waiting.
+
+        Args:
+            frames: ``(B, H, W, 3)`` uint8 BGR frames. Copied, so the caller
+                may reuse its buffer right away.
+        """
+        batch = np.array(frames, copy=True)
+        with self._cond:
+            if self._pending is not None:
+                logger.debug("Detector busy, dropping a stale batch")
+            self._pending = batch
+            # notify_all: wait() callers share the condition with the worker
+            self._cond.notify_all()
+
+    def poll(self) -> list[DetectionResult]:
+        """Return the results finished since the last call, in capture order."""
+        with self._cond:
+            results, self._results = self._results, []
+        return results
+
+    def wait(self, timeout: float) -> bool:
+        """Block until results are ready to poll, or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if results are ready.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: bool(self._results), timeout)
+
+    def cancel(self) -> None:
+        """Drop the pending batch and any results not yet polled or in flight."""
+        with self._cond:
+            self._pending = None
+            self._results = []
+            self._generation += 1
+
+    def close(self) -> None:
+        """Stop the worker thread (waits for the batch in flight)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
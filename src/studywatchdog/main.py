@@ -9,15 +9,24 @@ import argparse
 import logging
 import sys
 import time
+from collections import deque
+from collections.abc import Callable
 
 import cv2
 import numpy as np
 
+from studywatchdog._fastdraw import blend_fill
 from studywatchdog.alerter import Alerter
-from studywatchdog.camera import Camera, list_cameras
-from studywatchdog.config import AppConfig, CameraConfig, generate_default_config, load_config
+from studywatchdog.camera import Camera, FrameBuffer, ThreadedCamera, list_cameras
+from studywatchdog.config import (
+    AppConfig,
+    CameraConfig,
+    DecisionConfig,
+    generate_default_config,
+    load_config,
+)
 from studywatchdog.decision import DecisionEngine, StudyState
-from studywatchdog.detector import DetectionResult, SigLIPDetector
+from studywatchdog.detector import AsyncSigLIPDetector, DetectionResult, SigLIPDetector
 
 logger = logging.getLogger("studywatchdog")
 
@@ -51,6 +60,9 @@ STATE_ICONS = {
     StudyState.ALERT_ACTIVE: "!!",
 }
 
+# Debug window refresh target; waitKey() blocks for the rest of each period
+DISPLAY_PERIOD_S = 1 / 30
+
 # ── Toolbar ──
 TOOLBAR_H = 44
 BTN_W = 44
@@ -77,26 +89,34 @@ class ToolbarButton:
         self.y = 0
         self.w = BTN_W
         self.h = TOOLBAR_H - 2 * BTN_MARGIN
+        # Text sizes never change, measure them once
+        (self.icon_w, self.icon_h), _ = cv2.getTextSize(icon, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        (self.tooltip_w, self.tooltip_h), _ = cv2.getTextSize(
+            tooltip, cv2.FONT_HERSHEY_SIMPLEX, 0.45, 1
+        )
 
-    def contains(self, mx: int, my: int) -> bool:
-        """Check if a mouse position is inside this button."""
-        return self.x <= mx <= self.x + self.w and self.y <= my <= self.y + self.h
+    def draw(self, frame: np.ndarray, hover: bool = False, *, y_offset: int = 0) -> None:
+        """Draw the button on the frame.
 
-    def draw(self, frame: np.ndarray, hover: bool = False) -> None:
-        """Draw the button on the frame."""
+        Args:
+            frame: Image to draw on.
+            hover: Whether the mouse is over the button.
+            y_offset: Subtracted from the button's y position (for drawing
+                into a toolbar strip rather than the full canvas).
+        """
+        y = self.y - y_offset
         bg = C_BLUE if self.active else (C_GRAY if hover else C_DARK)
-        cv2.rectangle(frame, (self.x, self.y), (self.x + self.w, self.y + self.h), bg, -1)
+        cv2.rectangle(frame, (self.x, y), (self.x + self.w, y + self.h), bg, -1)
         cv2.rectangle(
             frame,
-            (self.x, self.y),
-            (self.x + self.w, self.y + self.h),
+            (self.x, y),
+            (self.x + self.w, y + self.h),
             C_LIGHT_GRAY if hover else C_GRAY,
             1,
         )
         # Center icon text
-        (tw, th), _ = cv2.getTextSize(self.icon, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
-        tx = self.x + (self.w - tw) // 2
-        ty = self.y + (self.h + th) // 2
+        tx = self.x + (self.w - self.icon_w) // 2
+        ty = y + (self.h + self.icon_h) // 2
         cv2.putText(
             frame, self.icon, (tx, ty),
             cv2.FONT_HERSHEY_SIMPLEX, 0.5, C_WHITE, 1, cv2.LINE_AA,
@@ -108,7 +128,13 @@ class DebugUI:
 
     WINDOW_NAME = "StudyWatchdog"
 
-    def __init__(self, available_cameras: list[int], current_camera: int) -> None:
+    def __init__(
+        self,
+        available_cameras: list[int],
+        current_camera: int,
+        *,
+        decision_config: DecisionConfig,
+    ) -> None:
         self._mouse_x = 0
         self._mouse_y = 0
         self._available_cameras = available_cameras
@@ -119,6 +145,20 @@ class DebugUI:
         )
         self._show_scores = True
         self._paused = False
+        # Set once the window has displayed a frame (closing it then quits)
+        self._shown = False
+        self._pause_badge = self._render_pause_badge()
+        # Score bars rendered for the result they show, reused until it changes
+        self._scores_result: DetectionResult | None = None
+        self._scores_rows: np.ndarray | None = None
+        self._distraction_timeout = decision_config.distraction_timeout
+        self._studying_threshold = decision_config.studying_threshold
+        # Output image (video + toolbar), reused across frames of the same size
+        self._canvas: np.ndarray | None = None
+        # Pre-rendered toolbar without hover effects; None = needs re-rendering
+        self._toolbar_base: np.ndarray | None = None
+        # Canvas row where the toolbar starts (None until first drawn)
+        self._toolbar_y: int | None = None
 
         # Build toolbar buttons
         self._btn_pause = ToolbarButton("pause", "||", "Pause/Resume detection (P)", toggle=True)
@@ -137,6 +177,21 @@ class DebugUI:
             self._btn_reset,
             self._btn_quit,
         ]
+        self._btn_actions: dict[str, Callable[[], None]] = {
+            "pause": self._toggle_pause,
+            "cam": self._cycle_camera,
+            "scores": self._toggle_scores,
+            "reset": self._request_reset,
+            "quit": self._request_quit,
+        }
+        # Keyboard shortcuts act like clicking the matching button
+        self._key_buttons: dict[int, ToolbarButton] = {
+            ord("p"): self._btn_pause,
+            ord("c"): self._btn_cam,
+            ord("s"): self._btn_scores,
+            ord("r"): self._btn_reset,
+            ord("q"): self._btn_quit,
+        }
 
         # Pending actions from clicks
         self.action_quit = False
@@ -154,31 +209,80 @@ class DebugUI:
         cv2.resizeWindow(self.WINDOW_NAME, 800, 600)
         cv2.setMouseCallback(self.WINDOW_NAME, self._on_mouse)
 
+    def window_open(self) -> bool:
+        """Check whether the window is still open, to decide whether to draw.
+
+        Once a frame has been shown, a visibility of 0 means the user closed
+        the window: this requests a quit (the shortcuts are gone with it).
+        Backends that don't report visibility return -1 and count as open.
+
+        Returns:
+            False if the window was closed.
+        """
+        visible = cv2.getWindowProperty(self.WINDOW_NAME, cv2.WND_PROP_VISIBLE)
+        if self._shown and 0 <= visible < 1:
+            logger.info("Debug window closed")
+            self.action_quit = True
+            return False
+        return True
+
+    def show(self, display: np.ndarray) -> None:
+        """Display a drawn frame in the window."""
+        cv2.imshow(self.WINDOW_NAME, display)
+        self._shown = True
+
     def _on_mouse(self, event: int, x: int, y: int, _flags: int, _param: object) -> None:
         """Handle mouse events."""
         self._mouse_x = x
         self._mouse_y = y
         if event == cv2.EVENT_LBUTTONDOWN:
-            for btn in self._buttons:
-                if btn.contains(x, y):
-                    self._handle_button_click(btn)
-                    break
+            btn = self._hit_test(x, y)
+            if btn is not None:
+                self._handle_button_click(btn)
+
+    def _hit_test(self, mx: int, my: int) -> ToolbarButton | None:
+        """Find the toolbar button at a canvas position.
+
+        Buttons are equal-sized and laid out left to right, so the index
+        follows directly from the x coordinate.
+
+        Returns:
+            The button under the position, or None.
+        """
+        if self._toolbar_y is None:
+            return None
+        top = self._toolbar_y + BTN_MARGIN
+        if not top <= my <= top + TOOLBAR_H - 2 * BTN_MARGIN:
+            return None
+        idx, offset = divmod(mx - BTN_MARGIN, BTN_W + BTN_MARGIN)
+        if 0 <= idx < len(self._buttons) and offset <= BTN_W:
+            return self._buttons[idx]
+        return None
 
     def _handle_button_click(self, btn: ToolbarButton) -> None:
         """Process a toolbar button click."""
-        if btn.key == "pause":
-            self._paused = not self._paused
-            btn.active = self._paused
-            logger.info("Detection %s", "PAUSED" if self._paused else "RESUMED")
-        elif btn.key == "cam":
-            self._cycle_camera()
-        elif btn.key == "scores":
-            self._show_scores = not self._show_scores
-            btn.active = self._show_scores
-        elif btn.key == "reset":
-            self.action_reset = True
-        elif btn.key == "quit":
-            self.action_quit = True
+        # Toggle buttons change color, so the cached toolbar must be redrawn
+        self._toolbar_base = None
+        self._btn_actions[btn.key]()
+
+    def _toggle_pause(self) -> None:
+        """Pause or resume detection."""
+        self._paused = not self._paused
+        self._btn_pause.active = self._paused
+        logger.info("Detection %s", "PAUSED" if self._paused else "RESUMED")
+
+    def _toggle_scores(self) -> None:
+        """Show or hide the scores panel."""
+        self._show_scores = not self._show_scores
+        self._btn_scores.active = self._show_scores
+
+    def _request_reset(self) -> None:
+        """Ask the main loop to reset the decision state."""
+        self.action_reset = True
+
+    def _request_quit(self) -> None:
+        """Ask the main loop to exit."""
+        self.action_quit = True
 
     def _cycle_camera(self) -> None:
         """Switch to the next available camera."""
@@ -194,16 +298,9 @@ class DebugUI:
 
     def handle_key(self, key: int) -> None:
         """Handle keyboard shortcuts."""
-        if key == ord("q"):
-            self.action_quit = True
-        elif key == ord("p"):
-            self._handle_button_click(self._btn_pause)
-        elif key == ord("c"):
-            self._cycle_camera()
-        elif key == ord("s"):
-            self._handle_button_click(self._btn_scores)
-        elif key == ord("r"):
-            self.action_reset = True
+        btn = self._key_buttons.get(key)
+        if btn is not None:
+            self._handle_button_click(btn)
 
     def draw(
         self,
@@ -223,11 +320,18 @@ class DebugUI:
             camera_idx: Active camera index.
 
         Returns:
-            Frame with overlay drawn (includes toolbar).
+            Frame with overlay drawn (includes toolbar). The array is reused
+            by the next call.
         """
         h, w = frame.shape[:2]
-        canvas = np.zeros((h + TOOLBAR_H, w, 3), dtype=np.uint8)
-        overlay = frame.copy()
+        if self._canvas is None or self._canvas.shape[:2] != (h + TOOLBAR_H, w):
+            # No zeroing: the frame and the toolbar strip cover every pixel
+            self._canvas = np.empty((h + TOOLBAR_H, w, 3), dtype=np.uint8)
+        canvas = self._canvas
+        # Draw on the canvas, never on the frame itself: the threaded camera
+        # may return the same frame object on the next call
+        overlay = canvas[:h]
+        np.copyto(overlay, frame)
 
         state = engine.state
         color = STATE_COLORS[state]
@@ -237,8 +341,7 @@ class DebugUI:
         # ── Semi-transparent state banner ──
         banner_h = 48
         sub = overlay[0:banner_h, 0:w]
-        banner_bg = np.full_like(sub, color, dtype=np.uint8)
-        cv2.addWeighted(banner_bg, 0.75, sub, 0.25, 0, sub)
+        blend_fill(sub, *color, 0.75)
 
         cv2.putText(
             overlay, f" {icon} {label}", (8, 34),
@@ -248,7 +351,7 @@ class DebugUI:
         # Time in state (right side)
         tis = engine.time_in_state
         if state == StudyState.DISTRACTED:
-            remaining = max(0, engine._config.distraction_timeout - tis)
+            remaining = max(0, self._distraction_timeout - tis)
             time_str = f"alert in {remaining:.0f}s"
         elif state == StudyState.ALERT_ACTIVE:
             time_str = f"rickroll for {tis:.0f}s"
@@ -265,7 +368,7 @@ class DebugUI:
         bar_margin = 12
         bar_w = w - 2 * bar_margin
         ema = engine.ema_studying
-        thresh = engine._config.studying_threshold
+        thresh = self._studying_threshold
 
         cv2.rectangle(
             overlay, (bar_margin, bar_y), (bar_margin + bar_w, bar_y + bar_h), C_DARK, -1,
@@ -282,16 +385,13 @@ class DebugUI:
             cv2.FONT_HERSHEY_SIMPLEX, 0.45, C_WHITE, 1, cv2.LINE_AA,
         )
 
-        # ── Paused overlay ──
+        # ── Paused overlay (centered) ──
         if self._paused:
-            pause_label = "PAUSED"
-            (pw, ph), _ = cv2.getTextSize(pause_label, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 3)
-            px, py = (w - pw) // 2, h // 2 + ph // 2
-            cv2.rectangle(overlay, (px - 16, py - ph - 12), (px + pw + 16, py + 12), C_DARK, -1)
-            cv2.putText(
-                overlay, pause_label, (px, py),
-                cv2.FONT_HERSHEY_SIMPLEX, 1.2, C_ORANGE, 3, cv2.LINE_AA,
-            )
+            badge = self._pause_badge
+            bh, bw = badge.shape[:2]
+            bx, by = (w - bw + 1) // 2, (h - bh + 1) // 2
+            if bx >= 0 and by >= 0:
+                overlay[by : by + bh, bx : bx + bw] = badge
 
         # ── Scores panel (right side) ──
         if self._show_scores and result is not None:
@@ -306,67 +406,109 @@ class DebugUI:
             cv2.FONT_HERSHEY_SIMPLEX, 0.4, C_LIGHT_GRAY, 1, cv2.LINE_AA,
         )
 
-        # Compose canvas
-        canvas[0:h, 0:w] = overlay
         self._draw_toolbar(canvas, w, h)
         return canvas
 
+    @staticmethod
+    def _render_pause_badge() -> np.ndarray:
+        """Render the opaque "PAUSED" badge once, to be copied onto paused frames."""
+        label = "PAUSED"
+        (pw, ph), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 3)
+        badge = np.full((ph + 25, pw + 33, 3), C_DARK, dtype=np.uint8)
+        cv2.putText(
+            badge, label, (16, ph + 12),
+            cv2.FONT_HERSHEY_SIMPLEX, 1.2, C_ORANGE, 3, cv2.LINE_AA,
+        )
+        return badge
+
     def _draw_scores_panel(
         self, overlay: np.ndarray, result: DetectionResult, w: int
     ) -> None:
-        """Draw per-category score bars on the right side."""
+        """Draw per-category score bars on the right side.
+
+        Results arrive every few seconds while frames are drawn continuously,
+        so the opaque bars are rendered once per result and copied in between.
+        """
         panel_w = 220
         panel_x = w - panel_w - 8
         panel_y = 82
-        categories = [
-            ("Studying", result.studying_score, C_GREEN),
-            ("Distracted", result.not_studying_score, C_YELLOW),
-            ("Absent", result.absent_score, C_GRAY),
-        ]
-        for i, (lbl, score, clr) in enumerate(categories):
+        bar_h = 20
+        if self._scores_rows is None or self._scores_result is not result:
+            categories = [
+                ("Studying", result.studying_score, C_GREEN),
+                ("Distracted", result.not_studying_score, C_YELLOW),
+                ("Absent", result.absent_score, C_GRAY),
+            ]
+            rows = np.empty((len(categories), bar_h + 1, panel_w + 1, 3), dtype=np.uint8)
+            for row, (lbl, score, clr) in zip(rows, categories, strict=True):
+                cv2.rectangle(row, (0, 0), (panel_w, bar_h), C_DARK, -1)
+                fill = max(1, int(panel_w * score))
+                cv2.rectangle(row, (0, 0), (fill, bar_h), clr, -1)
+                cv2.putText(
+                    row, f"{lbl}: {score:.0%}", (4, 15),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, C_WHITE, 1, cv2.LINE_AA,
+                )
+            self._scores_rows = rows
+            self._scores_result = result
+        # Clamp to the frame; on small frames the bars are cropped on the left
+        # and bottom, like cv2.rectangle would clip them
+        x0 = max(panel_x, 0)
+        x1 = min(panel_x + panel_w + 1, overlay.shape[1])
+        for i, row in enumerate(self._scores_rows):
             y = panel_y + i * 28
-            cv2.rectangle(overlay, (panel_x, y), (panel_x + panel_w, y + 20), C_DARK, -1)
-            fill = max(1, int(panel_w * score))
-            cv2.rectangle(overlay, (panel_x, y), (panel_x + fill, y + 20), clr, -1)
-            cv2.putText(
-                overlay, f"{lbl}: {score:.0%}", (panel_x + 4, y + 15),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.4, C_WHITE, 1, cv2.LINE_AA,
-            )
+            dst = overlay[y : y + bar_h + 1, x0:x1]
+            if dst.size:
+                dst[:] = row[: dst.shape[0], x0 - panel_x : x1 - panel_x]
 
     def _draw_toolbar(self, canvas: np.ndarray, w: int, video_h: int) -> None:
         """Draw the interactive toolbar at the bottom."""
         toolbar_y = video_h
-        cv2.rectangle(canvas, (0, toolbar_y), (w, toolbar_y + TOOLBAR_H), C_DARK, -1)
-        cv2.line(canvas, (0, toolbar_y), (w, toolbar_y), C_GRAY, 1)
+        base = self._toolbar_base
+        if base is None or base.shape[1] != w or self._toolbar_y != toolbar_y:
+            base = self._toolbar_base = self._render_toolbar(w, toolbar_y)
+        np.copyto(canvas[toolbar_y : toolbar_y + TOOLBAR_H], base)
+
+        # Only the hovered button differs from the cached strip
+        hovered = self._hit_test(self._mouse_x, self._mouse_y)
+        if hovered is not None:
+            hovered.draw(canvas, hover=True)
+            self._draw_tooltip(canvas, hovered, toolbar_y)
+
+    def _render_toolbar(self, w: int, toolbar_y: int) -> np.ndarray:
+        """Lay out the buttons and render the toolbar strip without hover effects.
+
+        Args:
+            w: Toolbar width in pixels.
+            toolbar_y: Canvas row where the toolbar starts.
+
+        Returns:
+            BGR image of shape (TOOLBAR_H, w, 3).
+        """
+        self._toolbar_y = toolbar_y
+        strip = np.full((TOOLBAR_H, w, 3), C_DARK, dtype=np.uint8)
+        cv2.line(strip, (0, 0), (w, 0), C_GRAY, 1)
 
-        # Position and draw buttons
         x = BTN_MARGIN
         for btn in self._buttons:
             btn.x = x
             btn.y = toolbar_y + BTN_MARGIN
-            hover = btn.contains(self._mouse_x, self._mouse_y)
-            btn.draw(canvas, hover=hover)
+            btn.draw(strip, y_offset=toolbar_y)
             x += btn.w + BTN_MARGIN
 
-        # Tooltip for hovered button
-        for btn in self._buttons:
-            if btn.contains(self._mouse_x, self._mouse_y):
-                self._draw_tooltip(canvas, btn, toolbar_y)
-                break
-
         # Keyboard shortcuts hint (right side)
         cv2.putText(
-            canvas, "P=pause  C=cam  S=score  R=reset  Q=quit",
-            (w - 360, toolbar_y + 28),
+            strip, "P=pause  C=cam  S=score  R=reset  Q=quit",
+            (w - 360, 28),
             cv2.FONT_HERSHEY_SIMPLEX, 0.38, C_LIGHT_GRAY, 1, cv2.LINE_AA,
         )
+        return strip
 
     def _draw_tooltip(
         self, canvas: np.ndarray, btn: ToolbarButton, toolbar_y: int
     ) -> None:
         """Draw a tooltip above the toolbar for the given button."""
         text = btn.tooltip
-        (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.45, 1)
+        tw, th = btn.tooltip_w, btn.tooltip_h
         tx, ty = btn.x, toolbar_y - 8
         pad = 6
         cv2.rectangle(
@@ -384,6 +526,17 @@ class DebugUI:
 # ── CLI ──
 
 
+def _non_negative_int(value: str) -> int:
+    """Argparse type for counts that may be zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -423,6 +576,10 @@ def parse_args() -> argparse.Namespace:
         "--config", type=str, default=None,
         help="Path to TOML config file",
     )
+    parser.add_argument(
+        "--warmup", type=_non_negative_int, default=None, metavar="N",
+        help="Dummy detections to run after loading the model (default: 3, 0 = off)",
+    )
     parser.add_argument(
         "--log-level", type=str, default=None,
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -450,6 +607,8 @@ def _apply_cli_overrides(config: AppConfig, args: argparse.Namespace) -> None:
         config.camera.capture_interval = args.interval
     if args.timeout is not None:
         config.decision.distraction_timeout = args.timeout
+    if args.warmup is not None:
+        config.detector.warmup_steps = args.warmup
     if args.log_level is not None:
         config.log_level = args.log_level
 
@@ -467,18 +626,22 @@ def _switch_camera(camera: Camera, new_index: int, config: AppConfig) -> Camera:
     """
     camera.close()
     config.camera.camera_index = new_index
-    new_camera = Camera(
-        CameraConfig(
-            camera_index=new_index,
-            capture_interval=config.camera.capture_interval,
-            frame_width=config.camera.frame_width,
-            frame_height=config.camera.frame_height,
-        )
-    )
+    new_camera = _create_camera(config.camera.model_copy(), debug=config.debug)
     new_camera.open()
     return new_camera
 
 
+def _create_camera(config: CameraConfig, *, debug: bool) -> Camera:
+    """Create a threaded or plain camera depending on config.
+
+    Headless, a frame is only read when one is due for analysis, so a capture
+    thread would decode frames nobody uses: the plain camera is used instead.
+    """
+    if config.threaded_capture and debug:
+        return ThreadedCamera(config)
+    return Camera(config)
+
+
 def main() -> None:
     """Start the StudyWatchdog application."""
     args = parse_args()
@@ -515,6 +678,11 @@ def main() -> None:
     _apply_cli_overrides(config, args)
     setup_logging(config.log_level)
 
+    # OpenCV work here is small (the 9x8 scene-change thumbnail when
+    # scene_change_bits > 0, overlay drawing); its worker pool would only
+    # compete with the model for CPU cores
+    cv2.setNumThreads(1)
+
     logger.info("StudyWatchdog starting...")
     logger.info("Debug mode: %s", "ON" if config.debug else "OFF")
     logger.info(
@@ -541,25 +709,33 @@ def main() -> None:
         config.camera.camera_index = fallback
 
     # Initialize components
-    camera = Camera(config.camera)
+    camera = _create_camera(config.camera, debug=config.debug)
     detector = SigLIPDetector(config.detector)
     engine = DecisionEngine(config.decision)
     alerter = Alerter(config.alert)
 
-    # Pre-load model
+    # Pre-load model, warming it up at the capture size on the inference thread
     logger.info("Loading AI model (this may take a moment on first run)...")
-    detector.load()
+    frame_shape = (config.camera.frame_height, config.camera.frame_width)
+    async_detector: AsyncSigLIPDetector | None = None
+    if config.detector.async_inference:
+        async_detector = AsyncSigLIPDetector(detector, frame_shape=frame_shape)
+        async_detector.wait_ready()
+    else:
+        detector.load(frame_shape)
     logger.info("Model ready!")
 
     # UI
     ui: DebugUI | None = None
     if config.debug:
-        ui = DebugUI(available_cameras, config.camera.camera_index)
+        ui = DebugUI(available_cameras, config.camera.camera_index, decision_config=config.decision)
 
     # Main loop state
+    frame: np.ndarray | None = None
     last_result: DetectionResult | None = None
-    frame_count = 0
-    fps_start = time.monotonic()
+    frame_buffer = FrameBuffer(config.detector.batch_size)
+    # Timestamps of the last loop iterations; FPS is measured over this window
+    frame_times_ns: deque[int] = deque(maxlen=30)
     fps = 0.0
 
     try:
@@ -569,15 +745,47 @@ def main() -> None:
         logger.info("Main loop started. Press Ctrl+C (or Q) to stop.")
 
         while True:
-            frame = camera.read_frame()
-            if frame is None:
-                logger.error("Lost camera feed. Exiting.")
-                break
-
+            loop_start = time.monotonic()
             # Run detection at configured interval (unless paused)
-            if not (ui and ui.paused) and camera.should_capture():
-                last_result = detector.detect(frame)
-                state = engine.update(last_result)
+            capture = not (ui and ui.paused) and camera.should_capture()
+            # Headless, frames are only needed when one is analyzed; while
+            # paused, the debug window keeps showing the last frame
+            need_frame = capture if ui is None else (not ui.paused or frame is None)
+            if need_frame:
+                frame = camera.read_frame()
+                if frame is None:
+                    logger.error("Lost camera feed. Exiting.")
+                    break
+
+            results: list[DetectionResult] = []
+            reused: DetectionResult | None = None
+            if capture:
+                # Only gate a new batch once there is a result to reuse; frames
+                # pushed anyway still become the scene-change reference
+                gate = last_result is not None and not frame_buffer
+                if camera.should_infer(frame, force=not gate):
+                    frame_buffer.push(frame)
+                else:
+                    # Scene unchanged: reuse the last result so FSM timers keep running
+                    reused = last_result
+
+            if frame_buffer.is_full:
+                if async_detector is not None:
+                    async_detector.submit(frame_buffer.frames())
+                else:
+                    results = detector.detect_batch(frame_buffer.frames())
+                frame_buffer.clear()
+            if async_detector is not None:
+                results.extend(async_detector.poll())
+            if reused is not None:
+                # Appended after polled results (which were captured earlier),
+                # repeating the newest one, so the sequence stays in order
+                results.append(results[-1] if results else reused)
+
+            if results:
+                # Feed results in capture order so EMA/FSM see the true sequence
+                for last_result in results:
+                    state = engine.update(last_result)
 
                 if state == StudyState.ALERT_ACTIVE:
                     alerter.play()
@@ -585,21 +793,23 @@ def main() -> None:
                     alerter.stop()
 
             # FPS
-            frame_count += 1
-            elapsed = time.monotonic() - fps_start
-            if elapsed >= 1.0:
-                fps = frame_count / elapsed
-                frame_count = 0
-                fps_start = time.monotonic()
+            frame_times_ns.append(time.monotonic_ns())
+            span_ns = frame_times_ns[-1] - frame_times_ns[0]
+            if span_ns > 0:
+                fps = (len(frame_times_ns) - 1) * 1e9 / span_ns
 
             # Debug window
             if ui:
-                display = ui.draw(
-                    frame, engine, last_result, fps, config.camera.camera_index
-                )
-                cv2.imshow(ui.WINDOW_NAME, display)
-
-                key = cv2.waitKey(1) & 0xFF
+                # A closed window turns into a quit request; imshow would
+                # otherwise recreate it without its mouse callback
+                if ui.window_open():
+                    display = ui.draw(frame, engine, last_result, fps, config.camera.camera_index)
+                    ui.show(display)
+
+                # Block for what is left of the display period instead of
+                # spinning (reads no longer pace the loop while paused)
+                delay_ms = int((DISPLAY_PERIOD_S - (time.monotonic() - loop_start)) * 1000)
+                key = cv2.waitKey(max(1, delay_ms)) & 0xFF
                 if key != 255:
                     ui.handle_key(key)
 
@@ -611,6 +821,9 @@ def main() -> None:
                 if ui.action_reset:
                     engine.reset()
                     alerter.stop()
+                    frame_buffer.clear()
+                    if async_detector is not None:
+                        async_detector.cancel()
                     last_result = None
                     logger.info("Manual reset triggered.")
                     ui.action_reset = False
@@ -620,18 +833,29 @@ def main() -> None:
                     ui.action_switch_camera = None
                     try:
                         camera = _switch_camera(camera, new_idx, config)
+                        frame = None
                         engine.reset()
                         alerter.stop()
+                        frame_buffer.clear()
+                        if async_detector is not None:
+                            async_detector.cancel()
                         last_result = None
                         logger.info("Switched to camera %d", new_idx)
                     except RuntimeError:
                         logger.error("Cannot open camera %d", new_idx)
             else:
-                time.sleep(0.03)
+                # Sleep until the next capture; wake early for async results
+                sleep_s = camera.seconds_until_next_capture()
+                if async_detector is not None:
+                    async_detector.wait(sleep_s)
+                else:
+                    time.sleep(sleep_s)
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user.")
     finally:
+        if async_detector is not None:
+            async_detector.close()
         alerter.stop()
         alerter.cleanup()
         camera.close()
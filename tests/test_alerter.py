@@ -0,0 +1,165 @@
+"""Tests for the alerter's audio backends (fake audio modules, no device needed)."""
+
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from studywatchdog.alerter import Alerter, _PygameBackend, _SoundDeviceBackend
+from studywatchdog.config import AlertConfig
+
+
+class _FakeSoundFile:
+    """In-memory stand-in for ``soundfile.SoundFile`` (mono)."""
+
+    samplerate = 44100
+    channels = 1
+
+    def __init__(self, samples: np.ndarray) -> None:
+        self._samples = samples
+        self._pos = 0
+        self.closed = False
+
+    def read(self, dtype: str, out: np.ndarray) -> np.ndarray:
+        chunk = self._samples[self._pos : self._pos + len(out)]
+        out[: len(chunk), 0] = chunk
+        self._pos += len(chunk)
+        return out[: len(chunk)]
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int) -> None:
+        self._pos = pos
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeStream:
+    """Stand-in for ``sounddevice.OutputStream``."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.started = False
+        self.closed = False
+
+    def start(self) -> None:
+        self.started = True
+
+    def stop(self) -> None:
+        self.started = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _PortAudioError(Exception):
+    pass
+
+
+@pytest.fixture
+def audio(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    """Install fake ``sounddevice`` and ``soundfile`` modules.
+
+    Returns:
+        Namespace with ``samples`` (file contents), ``files`` (opened files),
+        ``streams`` (created streams) and ``stream_error`` (raised on creation).
+    """
+    state = types.SimpleNamespace(
+        samples=np.arange(1, 6, dtype=np.float32), files=[], streams=[], stream_error=None
+    )
+
+    def open_file(_path: str) -> _FakeSoundFile:
+        state.files.append(_FakeSoundFile(state.samples))
+        return state.files[-1]
+
+    def open_stream(**kwargs: Any) -> _FakeStream:
+        if state.stream_error is not None:
+            raise state.stream_error
+        state.streams.append(_FakeStream(**kwargs))
+        return state.streams[-1]
+
+    sounddevice = types.ModuleType("sounddevice")
+    sounddevice.PortAudioError = _PortAudioError  # type: ignore[attr-defined]
+    sounddevice.OutputStream = open_stream  # type: ignore[attr-defined]
+    soundfile = types.ModuleType("soundfile")
+    soundfile.SoundFileError = type("SoundFileError", (Exception,), {})  # type: ignore[attr-defined]
+    soundfile.SoundFile = open_file  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "sounddevice", sounddevice)
+    monkeypatch.setitem(sys.modules, "soundfile", soundfile)
+    return state
+
+
+def _backend(volume: float = 1.0) -> _SoundDeviceBackend:
+    backend = _SoundDeviceBackend()
+    backend.open(volume)
+    return backend
+
+
+class TestBackendSelection:
+    """Test that the configured backend is used."""
+
+    def test_default_is_pygame(self) -> None:
+        assert isinstance(Alerter(AlertConfig())._backend, _PygameBackend)
+
+    def test_sounddevice(self) -> None:
+        alerter = Alerter(AlertConfig(backend="sounddevice"))
+        assert isinstance(alerter._backend, _SoundDeviceBackend)
+
+
+class TestSoundDeviceBackend:
+    """Test streaming, looping and cleanup of the sounddevice backend."""
+
+    def test_fill_loops_at_end_of_file(self, audio: types.SimpleNamespace) -> None:
+        backend = _backend(volume=0.5)
+        backend.play(Path("song.wav"))
+        outdata = np.empty((12, 1), dtype=np.float32)
+        backend._fill(outdata, 12, None, None)
+        expected = np.array([1, 2, 3, 4, 5, 1, 2, 3, 4, 5, 1, 2], dtype=np.float32) * 0.5
+        np.testing.assert_array_equal(outdata[:, 0], expected)
+
+    def test_fill_empty_file_is_silent(self, audio: types.SimpleNamespace) -> None:
+        audio.samples = np.empty(0, dtype=np.float32)
+        backend = _backend()
+        backend.play(Path("empty.wav"))
+        outdata = np.ones((4, 1), dtype=np.float32)
+        backend._fill(outdata, 4, None, None)
+        assert not outdata.any()
+
+    def test_play_starts_stream_in_file_format(self, audio: types.SimpleNamespace) -> None:
+        backend = _backend()
+        backend.play(Path("song.wav"))
+        (stream,) = audio.streams
+        assert stream.started
+        assert stream.kwargs["samplerate"] == 44100
+        assert stream.kwargs["channels"] == 1
+
+    def test_stop_closes_stream_and_file(self, audio: types.SimpleNamespace) -> None:
+        backend = _backend()
+        backend.play(Path("song.wav"))
+        backend.stop()
+        assert audio.streams[0].closed
+        assert audio.files[0].closed
+        backend.stop()  # Idempotent
+
+    def test_failed_stream_closes_file(self, audio: types.SimpleNamespace) -> None:
+        audio.stream_error = _PortAudioError("no output device")
+        backend = _backend()
+        with pytest.raises(_PortAudioError):
+            backend.play(Path("song.wav"))
+        assert audio.files[0].closed
+
+    def test_alerter_logs_playback_failure(
+        self, audio: types.SimpleNamespace, tmp_path: Path
+    ) -> None:
+        audio.stream_error = _PortAudioError("no output device")
+        song = tmp_path / "song.wav"
+        song.touch()
+        alerter = Alerter(AlertConfig(backend="sounddevice", rickroll_path=song))
+        alerter.play()
+        assert not alerter.is_playing
+        assert audio.files[0].closed
@@ -0,0 +1,185 @@
+"""Tests for camera helpers (no real camera device needed)."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from studywatchdog import camera as camera_module
+from studywatchdog.camera import (
+    Camera,
+    FrameBuffer,
+    ThreadedCamera,
+    frame_dhash,
+    list_cameras,
+)
+from studywatchdog.config import CameraConfig
+
+
+def _frame(value: int, h: int = 4, w: int = 6) -> np.ndarray:
+    """Create a solid-color BGR frame."""
+    return np.full((h, w, 3), value, dtype=np.uint8)
+
+
+def _gradient(h: int = 48, w: int = 64, *, flip: bool = False) -> np.ndarray:
+    """Create a horizontal gradient BGR frame (optionally mirrored)."""
+    row = np.linspace(0, 255, w, dtype=np.uint8)
+    if flip:
+        row = row[::-1]
+    return np.repeat(np.tile(row, (h, 1))[:, :, None], 3, axis=2)
+
+
+class _FakeCapture:
+    """Minimal VideoCapture stand-in yielding a fixed number of frames (~100 fps)."""
+
+    def __init__(self, n_frames: int, first_delay: float = 0.0) -> None:
+        self._remaining = n_frames
+        self._first_delay = first_delay
+
+    def isOpened(self) -> bool:  # noqa: N802 - mirrors cv2.VideoCapture
+        return True
+
+    def grab(self) -> bool:
+        return True
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if self._remaining == 0:
+            return False, None
+        self._remaining -= 1
+        time.sleep(0.01 + self._first_delay)
+        self._first_delay = 0.0
+        return True, _frame(self._remaining % 256)
+
+    def release(self) -> None:
+        pass
+
+
+class TestFrameBuffer:
+    """Test the pre-allocated frame batch buffer."""
+
+    def test_fills_in_order(self) -> None:
+        buf = FrameBuffer(3)
+        buf.push(_frame(1))
+        buf.push(_frame(2))
+        assert len(buf) == 2
+        assert not buf.is_full
+
+        buf.push(_frame(3))
+        assert buf.is_full
+        frames = buf.frames()
+        assert frames.shape == (3, 4, 6, 3)
+        assert [int(f[0, 0, 0]) for f in frames] == [1, 2, 3]
+
+    def test_push_copies_frame(self) -> None:
+        buf = FrameBuffer(2)
+        frame = _frame(5)
+        buf.push(frame)
+        frame[:] = 0
+        assert int(buf.frames()[0, 0, 0, 0]) == 5
+
+    def test_clear_reuses_storage(self) -> None:
+        buf = FrameBuffer(1)
+        buf.push(_frame(1))
+        storage = buf.frames().base
+        buf.clear()
+        assert len(buf) == 0
+        buf.push(_frame(2))
+        assert buf.frames().base is storage
+
+    def test_overflow_raises(self) -> None:
+        buf = FrameBuffer(1)
+        buf.push(_frame(1))
+        with pytest.raises(OverflowError):
+            buf.push(_frame(2))
+
+    def test_shape_change_reallocates(self) -> None:
+        buf = FrameBuffer(2)
+        buf.push(_frame(1))
+        buf.push(_frame(2, h=8, w=8))
+        assert len(buf) == 1
+        assert buf.frames().shape == (1, 8, 8, 3)
+
+
+class TestSceneChange:
+    """Test the dHash-based scene change gate."""
+
+    def test_identical_frames_same_hash(self) -> None:
+        assert frame_dhash(_gradient()) == frame_dhash(_gradient())
+
+    def test_noise_changes_few_bits(self) -> None:
+        rng = np.random.default_rng(0)
+        frame = _gradient()
+        noisy = np.clip(frame + rng.integers(-2, 3, frame.shape), 0, 255).astype(np.uint8)
+        assert (frame_dhash(frame) ^ frame_dhash(noisy)).bit_count() <= 4
+
+    def test_different_scene_changes_many_bits(self) -> None:
+        distance = (frame_dhash(_gradient()) ^ frame_dhash(_gradient(flip=True))).bit_count()
+        assert distance > 32
+
+    def test_should_infer_skips_unchanged(self) -> None:
+        camera = Camera(CameraConfig(scene_change_bits=4))
+        assert camera.should_infer(_gradient())
+        assert not camera.should_infer(_gradient())
+        assert camera.should_infer(_gradient(flip=True))
+
+    def test_forced_frame_becomes_reference(self) -> None:
+        camera = Camera(CameraConfig(scene_change_bits=4))
+        assert camera.should_infer(_gradient())
+        assert camera.should_infer(_gradient(flip=True), force=True)
+        assert not camera.should_infer(_gradient(flip=True))
+        assert camera.should_infer(_gradient())
+
+    def test_disabled_always_infers(self) -> None:
+        camera = Camera(CameraConfig(scene_change_bits=0))
+        assert camera.should_infer(_gradient())
+        assert camera.should_infer(_gradient())
+
+
+class TestListCameras:
+    """Test device probing without real cameras."""
+
+    def test_zero_max_index_probes_nothing(self) -> None:
+        assert list_cameras(0) == []
+
+
+class TestCaptureInterval:
+    """Test the capture interval timing."""
+
+    def test_seconds_until_next_capture(self) -> None:
+        camera = Camera(CameraConfig(capture_interval=5.0))
+        assert camera.seconds_until_next_capture() == 0.0
+        assert camera.should_capture()
+        assert 4.0 < camera.seconds_until_next_capture() <= 5.0
+
+
+class TestThreadedCamera:
+    """Test the background capture thread (fake capture device)."""
+
+    def _start(self, n_frames: int, first_delay: float = 0.0) -> ThreadedCamera:
+        camera = ThreadedCamera(CameraConfig())
+        # Skip device setup in open(): attach a fake capture, start the thread only
+        camera._cap = _FakeCapture(n_frames, first_delay)
+        camera._thread = threading.Thread(target=camera._capture_loop, daemon=True)
+        camera._thread.start()
+        return camera
+
+    def test_returns_latest_frame(self) -> None:
+        camera = self._start(1000)
+        frame = camera.read_frame()
+        assert frame is not None
+        assert frame.shape == (4, 6, 3)
+        camera.close()
+
+    def test_none_after_device_stops(self) -> None:
+        camera = self._start(2)
+        camera._thread.join()
+        assert camera.read_frame() is None
+        camera.close()
+
+    def test_waits_for_slow_first_frame(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(camera_module, "_THREAD_READ_TIMEOUT_S", 0.02)
+        camera = self._start(1000, first_delay=0.1)
+        frame = camera.read_frame()
+        assert frame is not None
+        camera.close()
@@ -0,0 +1,16 @@
+"""Tests for config loading and the default config template."""
+
+from pathlib import Path
+
+from studywatchdog.config import AppConfig, generate_default_config, load_config
+
+
+class TestConfigFile:
+    """Test config file generation and loading."""
+
+    def test_default_template_matches_defaults(self, tmp_path: Path) -> None:
+        path = generate_default_config(tmp_path / "config.toml")
+        assert load_config(path) == AppConfig()
+
+    def test_missing_file_uses_defaults(self, tmp_path: Path) -> None:
+        assert load_config(tmp_path / "missing.toml") == AppConfig()
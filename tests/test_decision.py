@@ -2,8 +2,16 @@
 
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
 from studywatchdog.config import DecisionConfig
-from studywatchdog.decision import DecisionEngine, StudyState
+from studywatchdog.decision import (
+    DecisionEngine,
+    StudyState,
+    ema_series,
+    replay_decisions,
+)
 from studywatchdog.detector import ActivityStatus, DetectionResult
 
 
@@ -53,6 +61,28 @@ class TestEMA:
         # EMA should still be well above threshold due to smoothing
         assert engine.ema_studying > 0.3
 
+    def test_ema_series_matches_recursive(self) -> None:
+        rng = np.random.default_rng(0)
+        raw = rng.random(2000)
+        for alpha in (0.01, 0.3, 1.0):
+            expected, ema = [], 1.0
+            for x in raw:
+                ema = alpha * x + (1.0 - alpha) * ema
+                expected.append(ema)
+            np.testing.assert_allclose(ema_series(raw, alpha), expected, atol=1e-12)
+
+    def test_ema_series_rejects_bad_alpha(self) -> None:
+        for alpha in (0.0, -0.5, 1.5, float("nan")):
+            with pytest.raises(ValueError):
+                ema_series(np.ones(3), alpha)
+
+    def test_update_batch_advances_ema(self) -> None:
+        engine = DecisionEngine(DecisionConfig(ema_alpha=0.5))
+        series = engine.update_batch(np.array([0.0, 0.0]))
+        np.testing.assert_allclose(series, [0.5, 0.25])
+        assert engine.ema_studying == 0.25
+        assert engine.state == StudyState.STUDYING
+
 
 class TestFSM:
     """Test FSM state transitions."""
@@ -151,3 +181,36 @@ class TestFSM:
         engine.reset()
         assert engine.state == StudyState.STUDYING
         assert engine.ema_studying == 1.0
+
+
+class TestReplay:
+    """Test the offline whole-session replay."""
+
+    def test_matches_online_engine(self) -> None:
+        config = DecisionConfig(ema_alpha=0.5, distraction_timeout=5.0, recovery_time=2.0)
+        rng = np.random.default_rng(0)
+        studying = rng.random(200)
+        timestamps = np.arange(200, dtype=np.float64)
+
+        with patch("studywatchdog.decision.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            engine = DecisionEngine(config)
+            online = []
+            for t, s in zip(timestamps, studying, strict=True):
+                mock_time.monotonic.return_value = t
+                online.append(engine.update(_make_result(studying=s, not_studying=1.0 - s)))
+
+        ratios = [DecisionEngine.studying_ratio(_make_result(s, 1.0 - s)) for s in studying]
+        replayed = replay_decisions(np.array(ratios), timestamps, config)
+        assert [StudyState(code) for code in replayed] == online
+
+    def test_alert_after_timeout(self) -> None:
+        config = DecisionConfig(ema_alpha=1.0, distraction_timeout=5.0)
+        ratios = np.array([0.1] * 10 + [0.9])
+        states = replay_decisions(ratios, np.arange(11.0), config)
+        assert states[0] == StudyState.DISTRACTED
+        assert states[5] == StudyState.ALERT_ACTIVE
+        assert states[-1] == StudyState.STUDYING
+
+    def test_empty_session(self) -> None:
+        assert replay_decisions(np.empty(0), np.empty(0), DecisionConfig()).shape == (0,)
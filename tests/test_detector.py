@@ -1,6 +1,12 @@
 """Tests for study activity detector."""
 
-from studywatchdog.detector import ActivityStatus, DetectionResult
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from studywatchdog.detector import ActivityStatus, AsyncSigLIPDetector, DetectionResult
 
 
 class TestDetectionResult:
@@ -29,3 +35,105 @@ class TestDetectionResult:
         total = result.studying_score + result.not_studying_score + result.absent_score
         # Scores can sum to anything, not necessarily 1.0
         assert total != 1.0 or True  # Just documenting the behavior
+
+    def test_equality_ignores_scores_array(self) -> None:
+        def make(status: ActivityStatus, scores: list[float]) -> DetectionResult:
+            return DetectionResult(
+                status=status,
+                confidence=0.9,
+                studying_score=0.9,
+                not_studying_score=0.05,
+                absent_score=0.05,
+                scores=np.array(scores, dtype=np.float32),
+            )
+
+        first = make(ActivityStatus.STUDYING, [0.1, 0.9])
+        second = make(ActivityStatus.STUDYING, [0.2, 0.8])
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first != make(ActivityStatus.ABSENT, [0.1, 0.9])
+
+
+class _FakeDetector:
+    """Stand-in for SigLIPDetector: one result per frame, tagged by pixel value."""
+
+    def __init__(self, *, loaded: bool = True, fail_load: bool = False) -> None:
+        self.loaded = loaded
+        self.fail_load = fail_load
+        self.load_thread: threading.Thread | None = None
+        self.frame_shape: tuple[int, int] | None = None
+
+    def is_loaded(self) -> bool:
+        return self.loaded
+
+    def load(self, frame_shape: tuple[int, int] | None = None) -> None:
+        if self.fail_load:
+            raise OSError("model download failed")
+        self.load_thread = threading.current_thread()
+        self.frame_shape = frame_shape
+        self.loaded = True
+
+    def detect_batch(self, frames: np.ndarray) -> list[DetectionResult]:
+        return [
+            DetectionResult(
+                status=ActivityStatus.STUDYING,
+                confidence=float(f[0, 0, 0]),
+                studying_score=1.0,
+                not_studying_score=0.0,
+                absent_score=0.0,
+            )
+            for f in frames
+        ]
+
+
+class TestAsyncDetector:
+    """Test the background detection worker."""
+
+    def _wait_for(self, detector: AsyncSigLIPDetector, n: int) -> list[DetectionResult]:
+        results: list[DetectionResult] = []
+        deadline = time.monotonic() + 5.0
+        while len(results) < n and time.monotonic() < deadline:
+            results += detector.poll()
+            time.sleep(0.001)
+        return results
+
+    def test_results_in_capture_order(self) -> None:
+        detector = AsyncSigLIPDetector(_FakeDetector())  # type: ignore[arg-type]
+        frames = np.stack([np.full((2, 2, 3), i, dtype=np.uint8) for i in range(3)])
+        detector.submit(frames)
+        results = self._wait_for(detector, 3)
+        detector.close()
+        assert [r.confidence for r in results] == [0.0, 1.0, 2.0]
+
+    def test_submit_copies_frames(self) -> None:
+        detector = AsyncSigLIPDetector(_FakeDetector())  # type: ignore[arg-type]
+        frames = np.full((1, 2, 2, 3), 7, dtype=np.uint8)
+        detector.submit(frames)
+        frames[:] = 0
+        results = self._wait_for(detector, 1)
+        detector.close()
+        assert results[0].confidence == 7.0
+
+    def test_wait_wakes_on_results(self) -> None:
+        detector = AsyncSigLIPDetector(_FakeDetector())  # type: ignore[arg-type]
+        assert not detector.wait(0.01)
+        detector.submit(np.zeros((1, 2, 2, 3), dtype=np.uint8))
+        assert detector.wait(5.0)
+        assert len(detector.poll()) == 1
+        detector.close()
+
+    def test_loads_on_worker_thread(self) -> None:
+        fake = _FakeDetector(loaded=False)
+        detector = AsyncSigLIPDetector(fake, frame_shape=(480, 640))  # type: ignore[arg-type]
+        detector.wait_ready()
+        detector.close()
+        assert fake.load_thread is not None
+        assert fake.load_thread is not threading.current_thread()
+        assert fake.frame_shape == (480, 640)
+
+    def test_wait_ready_raises_load_error(self) -> None:
+        fake = _FakeDetector(loaded=False, fail_load=True)
+        detector = AsyncSigLIPDetector(fake)  # type: ignore[arg-type]
+        with pytest.raises(OSError, match="download"):
+            detector.wait_ready()
+        detector.close()
@@ -0,0 +1,37 @@
+"""Tests for the debug overlay drawing kernels."""
+
+import cv2
+import numpy as np
+
+from studywatchdog._fastdraw import _blend_fill_cv2, _blend_fill_kernel, blend_fill
+
+
+def _reference(sub: np.ndarray, color: tuple[int, int, int], alpha: float) -> np.ndarray:
+    """Blend with cv2.addWeighted on a full color image."""
+    out = sub.copy()
+    cv2.addWeighted(np.full_like(sub, color), alpha, out, 1.0 - alpha, 0, out)
+    return out
+
+
+class TestBlendFill:
+    """Test the in-place banner blend."""
+
+    def test_kernel_matches_add_weighted(self) -> None:
+        rng = np.random.default_rng(0)
+        sub = rng.integers(0, 256, (4, 5, 3), dtype=np.uint8)
+        expected = _reference(sub, (0, 200, 220), 0.75)
+        _blend_fill_kernel(sub, 0, 200, 220, 0.75)
+        assert np.abs(sub.astype(int) - expected).max() <= 1
+
+    def test_opencv_fallback_matches_add_weighted(self) -> None:
+        rng = np.random.default_rng(1)
+        sub = rng.integers(0, 256, (4, 5, 3), dtype=np.uint8)
+        expected = _reference(sub, (0, 200, 220), 0.75)
+        _blend_fill_cv2(sub, 0, 200, 220, 0.75)
+        assert np.abs(sub.astype(int) - expected).max() <= 1
+
+    def test_blends_view_in_place(self) -> None:
+        frame = np.full((10, 8, 3), 255, dtype=np.uint8)
+        blend_fill(frame[:4], 0, 0, 0, 0.75)
+        assert (frame[:4] == 64).all()
+        assert (frame[4:] == 255).all()
@@ -0,0 +1,70 @@
+"""Tests for the debug UI (no real window needed)."""
+
+import cv2
+import numpy as np
+import pytest
+
+from studywatchdog.config import DecisionConfig
+from studywatchdog.detector import ActivityStatus, DetectionResult
+from studywatchdog.main import DebugUI
+
+
+def _ui() -> DebugUI:
+    return DebugUI([0], 0, decision_config=DecisionConfig())
+
+
+class TestWindowState:
+    """Test how the window visibility property is interpreted."""
+
+    def _visibility(self, monkeypatch: pytest.MonkeyPatch, value: float) -> None:
+        monkeypatch.setattr(cv2, "getWindowProperty", lambda _name, _prop: value)
+        monkeypatch.setattr(cv2, "imshow", lambda _name, _img: None)
+
+    def test_closed_window_requests_quit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ui = _ui()
+        self._visibility(monkeypatch, 0.0)
+        ui.show(np.zeros((4, 4, 3), dtype=np.uint8))
+        assert not ui.window_open()
+        assert ui.action_quit
+
+    def test_not_yet_shown_is_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ui = _ui()
+        self._visibility(monkeypatch, 0.0)
+        assert ui.window_open()
+        assert not ui.action_quit
+
+    def test_unsupported_property_is_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ui = _ui()
+        self._visibility(monkeypatch, -1.0)
+        ui.show(np.zeros((4, 4, 3), dtype=np.uint8))
+        assert ui.window_open()
+        assert not ui.action_quit
+
+
+class TestScoresPanel:
+    """Test the cached score bars on frames of any size."""
+
+    def _result(self) -> DetectionResult:
+        return DetectionResult(
+            status=ActivityStatus.STUDYING,
+            confidence=0.7,
+            studying_score=0.7,
+            not_studying_score=0.2,
+            absent_score=0.1,
+        )
+
+    def test_short_frame_is_clipped(self) -> None:
+        overlay = np.zeros((100, 640, 3), dtype=np.uint8)
+        _ui()._draw_scores_panel(overlay, self._result(), overlay.shape[1])
+        assert overlay[82:, 412:633].any()
+
+    def test_narrow_frame_is_clipped(self) -> None:
+        overlay = np.zeros((120, 160, 3), dtype=np.uint8)
+        _ui()._draw_scores_panel(overlay, self._result(), overlay.shape[1])
+        assert overlay.any()
+
+    def test_wide_frame_draws_full_panel(self) -> None:
+        overlay = np.zeros((240, 640, 3), dtype=np.uint8)
+        _ui()._draw_scores_panel(overlay, self._result(), overlay.shape[1])
+        assert overlay[82:103, 412:633].any()
+        assert not overlay[:, :412].any()